@@ -1,18 +1,70 @@
-from heapq import heappush, heappop
+from collections import OrderedDict
+from collections.abc import MutableSet
+from heapq import heappush, heappop, nsmallest
 import math
+import time
+
+class _WallSet(set):
+    """
+    The set behind Grid.walls: a plain set whose mutating methods also bump
+    the grid's version, so caches keyed on it see direct edits too.
+    """
+    def __init__(self, grid, walls=()):
+        super().__init__(walls)
+        self.grid = grid
+
+    def __reduce__(self):
+        return _WallSet, (self.grid, list(self))
+
+
+def _bumps_version(name):
+    method = getattr(set, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self.grid.version += 1
+        return result
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('add', 'discard', 'remove', 'pop', 'clear', 'update', 'difference_update',
+              'intersection_update', 'symmetric_difference_update',
+              '__ior__', '__isub__', '__iand__', '__ixor__'):
+    setattr(_WallSet, _name, _bumps_version(_name))
+del _name
+
 
 class Grid:
     def __init__(self, width, height, walls=None):
         self.w = width
         self.h = height
-        self.walls = set(walls) if walls else set()
+        self.version = 0    # bumped by every edit of walls
+        self._walls = _WallSet(self, walls or ())
+
+    @property
+    def walls(self):
+        """Set of wall cells; editing it (or assigning a new set) bumps version."""
+        return self._walls
+
+    @walls.setter
+    def walls(self, walls):
+        if walls is not self._walls:    # `walls |= ...` already bumped it
+            self._walls = _WallSet(self, walls)
+            self.version += 1
 
     def in_bounds(self, p):
         x, y = p
         return 0 <= x < self.w and 0 <= y < self.h
 
     def passable(self, p):
-        return p not in self.walls
+        return p not in self._walls
+
+    def add_wall(self, p):
+        self._walls.add(p)
+
+    def remove_wall(self, p):
+        self._walls.discard(p)
 
     def neighbors(self, p):
         x, y = p
@@ -26,6 +78,158 @@ class Grid:
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
+# map characters that count as open ground when loading text maps
+PASSABLE_CHARS = b'.GS0'
+# bytes.translate table: map character -> 1 for wall, 0 for open ground
+OCCUPANCY_TABLE = bytes(0 if c in PASSABLE_CHARS else 1 for c in range(256))
+
+
+class _WallView(MutableSet):
+    """
+    Live set-like view of a BitmapGrid's walls: O(1) membership, and
+    add/discard write through to the grid (bumping its version).
+    """
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __contains__(self, p):
+        return self.grid.in_bounds(p) and not self.grid.passable(p)
+
+    def __iter__(self):
+        w = self.grid.w
+        return ((i % w, i // w) for i, c in enumerate(self.grid.cells) if c)
+
+    def __len__(self):
+        cells = self.grid.cells
+        return len(cells) - cells.count(0)
+
+    def add(self, p):
+        self.grid.add_wall(p)
+
+    def discard(self, p):
+        self.grid.remove_wall(p)
+
+
+class BitmapGrid(Grid):
+    """
+    Grid with occupancy kept in a bytearray indexed by y*w + x (1 = wall).
+    Same interface as Grid, but far smaller on large maps and no tuple
+    hashing in passable()/neighbors().
+    Walls outside the grid are ignored, as they can never be reached
+    (with an index they would land on some other cell).
+    """
+    def __init__(self, width, height, walls=None, cells=None):
+        self.w = width
+        self.h = height
+        if cells is None:
+            cells = bytearray(width * height)
+        elif len(cells) != width * height:
+            raise ValueError('cells must hold width*height entries')
+        self.cells = cells
+        self.version = 0
+        for x, y in walls or ():
+            if 0 <= x < width and 0 <= y < height:
+                cells[y * width + x] = 1
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from a 2D list (rows[y][x]), truthy entries are walls."""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        cells = bytearray()
+        for row in rows:
+            if len(row) != width:
+                raise ValueError('all rows must have the same length')
+            cells.extend(map(bool, row))
+        return cls(width, height, cells=cells)
+
+    @classmethod
+    def from_text(cls, data):
+        """Build from map text, one row per line; PASSABLE_CHARS are open."""
+        if isinstance(data, str):
+            data = data.encode('ascii')
+        rows = data.split()
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError('all rows must have the same length')
+        # bulk convert: every byte maps to 1 (wall) unless it is passable
+        cells = bytearray(b''.join(rows).translate(OCCUPANCY_TABLE))
+        return cls(width, height, cells=cells)
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_text(f.read())
+
+    @property
+    def walls(self):
+        """Set-like view: cheap `p in walls`, iteration walks every cell."""
+        return _WallView(self)
+
+    @walls.setter
+    def walls(self, walls):
+        # `walls |= ...` / `walls -= ...` hand the view back, already applied
+        if isinstance(walls, _WallView) and walls.grid is self:
+            return
+        walls = list(walls)    # may be a view of this grid's own cells
+        cells, w, h = self.cells, self.w, self.h
+        cells[:] = bytes(len(cells))
+        for x, y in walls:
+            if 0 <= x < w and 0 <= y < h:
+                cells[y * w + x] = 1
+        self.version += 1
+
+    def add_wall(self, p):
+        x, y = p
+        if 0 <= x < self.w and 0 <= y < self.h:
+            self.cells[y * self.w + x] = 1
+            self.version += 1
+
+    def remove_wall(self, p):
+        x, y = p
+        if 0 <= x < self.w and 0 <= y < self.h:
+            self.cells[y * self.w + x] = 0
+            self.version += 1
+
+    def in_bounds(self, p):
+        x, y = p
+        return 0 <= x < self.w and 0 <= y < self.h
+
+    def passable(self, p):
+        x, y = p
+        return 0 <= x < self.w and 0 <= y < self.h and not self.cells[y * self.w + x]
+
+    def neighbors(self, p):
+        x, y = p
+        w = self.w
+        cells = self.cells
+        i = y * w + x
+        # same order as Grid.neighbors so searches break ties identically
+        if x + 1 < w and not cells[i + 1]:
+            yield (x + 1, y)
+        if x > 0 and not cells[i - 1]:
+            yield (x - 1, y)
+        if y + 1 < self.h and not cells[i + w]:
+            yield (x, y + 1)
+        if y > 0 and not cells[i - w]:
+            yield (x, y - 1)
+
+
+def random_grid(size, density, rng, grid_class=Grid):
+    """
+    Square map for demos and benchmarks: size*size*density walls dropped at
+    random cells drawn from rng (repeats collapse, so slightly fewer walls).
+    """
+    walls = {(rng.randrange(size), rng.randrange(size)) for _ in range(int(size * size * density))}
+    return grid_class(size, size, walls)
+
+
+def open_cells(grid):
+    """Every passable cell of grid, row by row."""
+    return [(x, y) for y in range(grid.h) for x in range(grid.w) if grid.passable((x, y))]
+
+
 def reconstruct_path(parent, current):
     path = []
     s = current
@@ -36,10 +240,61 @@ def reconstruct_path(parent, current):
     return path
 
 
-def astar(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn):
+class HeuristicCache:
+    """
+    Bounded LRU memo in front of an expensive heuristic_fn.
+    Call it like the wrapped function. Either pass one as heuristic_fn
+    (the cache then lives across searches) or give astar()/best_first()
+    heuristic_cache=<capacity> for a fresh cache per search.
+    hits / misses / evictions tell whether it pays off.
+    """
+    def __init__(self, heuristic_fn, capacity=4096):
+        self.heuristic_fn = heuristic_fn
+        self.capacity = capacity
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, s):
+        values = self.values
+        value = values.get(s)
+        if value is not None:
+            values.move_to_end(s)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = values[s] = self.heuristic_fn(s)
+        if len(values) > self.capacity:
+            values.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    @property
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def counters(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'hit_rate': self.hit_rate, 'size': len(self.values)}
+
+    def clear(self):
+        self.values.clear()
+
+
+def astar(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, stats=None,
+          heuristic_cache=None):
     """
     A* search: returns (path, cost) or (None, inf) if no path.
+    Pass a dict as stats to have it filled with search counters (see STAT_KEYS).
+    heuristic_cache=<capacity> memoizes heuristic_fn for this search (see HeuristicCache).
     """
+    if heuristic_cache is not None:
+        heuristic_fn = HeuristicCache(heuristic_fn, heuristic_cache)
+    if stats is not None:
+        return _search_with_stats(start, goal_test, neighbors_fn, g_cost_fn,
+                                  heuristic_fn, stats, greedy=False)
     if goal_test(start):
         return [start], 0
 
@@ -74,13 +329,21 @@ def astar(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn):
     return None, math.inf
 
 
-def best_first(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn):
+def best_first(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, stats=None,
+               heuristic_cache=None):
     """
     Greedy Best-First Search:
     - Uses only heuristic (h) for priority.
     - Tracks parent and g_score for reporting path & cost, but priority is only heuristic.
     - Not guaranteed optimal.
+    - Pass a dict as stats to have it filled with search counters (see STAT_KEYS).
+    - heuristic_cache=<capacity> memoizes heuristic_fn for this search (see HeuristicCache).
     """
+    if heuristic_cache is not None:
+        heuristic_fn = HeuristicCache(heuristic_fn, heuristic_cache)
+    if stats is not None:
+        return _search_with_stats(start, goal_test, neighbors_fn, g_cost_fn,
+                                  heuristic_fn, stats, greedy=True)
     if goal_test(start):
         return [start], 0
 
@@ -113,6 +376,466 @@ def best_first(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn):
     return None, math.inf
 
 
+# counters filled in by astar(..., stats={}) and best_first(..., stats={})
+STAT_KEYS = (
+    'expansions',      # nodes taken off the heap and expanded
+    'pushes',          # heap pushes
+    'stale_pops',      # pops skipped because the node was already closed
+    'reopenings',      # cheaper paths found to nodes that were already closed
+    'peak_open',       # largest heap size seen
+    'callback_time',   # seconds spent inside the four user callbacks
+    'goal_test_time',
+    'neighbors_time',
+    'g_cost_time',
+    'heuristic_time',
+    'heuristic_hits',  # HeuristicCache hits / misses, 0 without a cache
+    'heuristic_misses',
+)
+
+
+def _search_with_stats(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, stats, greedy):
+    """
+    Instrumented copy of the astar()/best_first() loop. Kept separate so the
+    plain searches pay nothing when stats are not requested; it pushes and
+    pops in exactly the same order, so results are identical.
+    """
+    clock = time.perf_counter
+    timing = {'goal_test_time': 0.0, 'neighbors_time': 0.0,
+              'g_cost_time': 0.0, 'heuristic_time': 0.0}
+
+    def timed(key, fn):
+        def wrapper(*args):
+            t0 = clock()
+            try:
+                return fn(*args)
+            finally:
+                timing[key] += clock() - t0
+        return wrapper
+
+    cache = heuristic_fn if isinstance(heuristic_fn, HeuristicCache) else None
+    hits0, misses0 = (cache.hits, cache.misses) if cache else (0, 0)
+
+    goal_test = timed('goal_test_time', goal_test)
+    # materialise the neighbors so time spent in a generator body is counted
+    neighbors_fn = timed('neighbors_time', lambda s, fn=neighbors_fn: list(fn(s)))
+    g_cost_fn = timed('g_cost_time', g_cost_fn)
+    heuristic_fn = timed('heuristic_time', heuristic_fn)
+
+    expansions = pushes = stale_pops = reopenings = 0
+    peak_open = 1
+
+    def finish(result):
+        stats.update(timing)
+        stats.update(expansions=expansions, pushes=pushes, stale_pops=stale_pops,
+                     reopenings=reopenings, peak_open=peak_open,
+                     callback_time=sum(timing.values()),
+                     heuristic_hits=cache.hits - hits0 if cache else 0,
+                     heuristic_misses=cache.misses - misses0 if cache else 0)
+        return result
+
+    if goal_test(start):
+        return finish(([start], 0))
+
+    open_heap = []
+    counter = 0
+    g_score = {start: 0}
+    parent = {start: None}
+    h = heuristic_fn(start)
+    heappush(open_heap, (h, counter, start) if greedy else (h, 0, counter, start))
+    pushes += 1
+    counter += 1
+    closed = set()
+
+    while open_heap:
+        current = heappop(open_heap)[-1]
+        if current in closed:
+            stale_pops += 1
+            continue
+        if goal_test(current):
+            return finish((reconstruct_path(parent, current), g_score[current]))
+        closed.add(current)
+        expansions += 1
+
+        for nb in neighbors_fn(current):
+            tentative_g = g_score[current] + g_cost_fn(current, nb)
+            if nb in g_score and tentative_g >= g_score[nb]:
+                continue
+            if nb in closed:
+                reopenings += 1
+            g_score[nb] = tentative_g
+            parent[nb] = current
+            h = heuristic_fn(nb)
+            if greedy:
+                heappush(open_heap, (h, counter, nb))
+            else:
+                heappush(open_heap, (tentative_g + h, tentative_g, counter, nb))
+            pushes += 1
+            counter += 1
+            if len(open_heap) > peak_open:
+                peak_open = len(open_heap)
+
+    return finish((None, math.inf))
+
+
+class StatsSummary:
+    """
+    Aggregates stats dicts from many searches:
+        summary = StatsSummary()
+        for ...: s = {}; astar(..., stats=s); summary.add(s)
+        print(summary.report())
+    Pass keys=BEAM_STAT_KEYS to aggregate beam_search() stats instead.
+    """
+    def __init__(self, keys=STAT_KEYS):
+        self.keys = keys
+        self.queries = 0
+        self.totals = dict.fromkeys(keys, 0)
+        self.maxima = dict.fromkeys(keys, 0)
+
+    def add(self, stats):
+        self.queries += 1
+        for key in self.keys:
+            value = stats.get(key, 0)
+            self.totals[key] += value
+            if value > self.maxima[key]:
+                self.maxima[key] = value
+
+    def mean(self, key):
+        return self.totals[key] / self.queries if self.queries else 0
+
+    def report(self):
+        lines = [f'{self.queries} queries',
+                 f'{"counter":<16}{"total":>14}{"mean":>14}{"max":>14}']
+        for key in self.keys:
+            if key.endswith('_time'):
+                lines.append(f'{key:<16}{self.totals[key]:>14.6f}'
+                             f'{self.mean(key):>14.6f}{self.maxima[key]:>14.6f}')
+            else:
+                lines.append(f'{key:<16}{self.totals[key]:>14}'
+                             f'{self.mean(key):>14.1f}{self.maxima[key]:>14}')
+        return '\n'.join(lines)
+
+
+def bidirectional_astar(start, goal, neighbors_fn, g_cost_fn, heuristic_fn,
+                        reverse_heuristic_fn, reverse_neighbors_fn=None):
+    """
+    Bidirectional A*: one frontier grows from start, guided by heuristic_fn
+    (estimate to goal), the other from goal, guided by reverse_heuristic_fn
+    (estimate to start).
+    - reverse_neighbors_fn(s) yields the predecessors of s; it defaults to
+      neighbors_fn, which is only right for undirected graphs.
+    - Both heuristics must be consistent.
+    - Stops once the best meeting cost is no larger than the smallest f on
+      either frontier, so the returned cost is optimal.
+    Returns (path, cost) or (None, inf) if no path.
+    """
+    if start == goal:
+        return [start], 0
+    if reverse_neighbors_fn is None:
+        reverse_neighbors_fn = neighbors_fn
+
+    # index 0 is the forward search, index 1 the backward search
+    open_heaps = ([], [])
+    g_scores = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    closed = (set(), set())
+    expand = (neighbors_fn, reverse_neighbors_fn)
+    heuristics = (heuristic_fn, reverse_heuristic_fn)
+    counter = 0
+    heappush(open_heaps[0], (heuristic_fn(start), 0, counter, start))
+    heappush(open_heaps[1], (reverse_heuristic_fn(goal), 0, counter + 1, goal))
+    counter += 2
+
+    best = math.inf
+    meet = None
+
+    while open_heaps[0] and open_heaps[1]:
+        if best <= max(open_heaps[0][0][0], open_heaps[1][0][0]):
+            break
+        # grow the smaller frontier
+        side = 0 if len(open_heaps[0]) <= len(open_heaps[1]) else 1
+        other = 1 - side
+        f, g, _, current = heappop(open_heaps[side])
+        if current in closed[side]:
+            continue
+        closed[side].add(current)
+
+        g_score = g_scores[side]
+        parent = parents[side]
+        for nb in expand[side](current):
+            if side == 0:
+                tentative_g = g_score[current] + g_cost_fn(current, nb)
+            else:
+                tentative_g = g_score[current] + g_cost_fn(nb, current)
+            if nb in g_score and tentative_g >= g_score[nb]:
+                continue
+            g_score[nb] = tentative_g
+            parent[nb] = current
+            heappush(open_heaps[side], (tentative_g + heuristics[side](nb), tentative_g, counter, nb))
+            counter += 1
+            if nb in g_scores[other] and tentative_g + g_scores[other][nb] < best:
+                best = tentative_g + g_scores[other][nb]
+                meet = nb
+
+    if meet is None:
+        return None, math.inf
+    path = reconstruct_path(parents[0], meet)
+    s = parents[1][meet]
+    while s is not None:
+        path.append(s)
+        s = parents[1][s]
+    return path, best
+
+
+def ara_star(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+             time_limit=0.002, weight=3.0, weight_step=0.5):
+    """
+    Anytime Repairing A* (ARA*): weighted A* that starts with an inflated
+    heuristic (f = g + weight*h), returns a first path quickly and then keeps
+    lowering the weight, reusing earlier search effort, until the weight
+    reaches 1 or time_limit seconds have passed.
+    - Generator: yields (path, cost, bound) every time a better path is
+      found, where cost <= bound * optimal cost.
+    - The last yielded path is the best one found within the time limit.
+    - Yields nothing if no path is found in time (or none exists).
+    """
+    deadline = time.perf_counter() + time_limit
+    if goal_test(start):
+        yield [start], 0, 1.0
+        return
+
+    counter = 0
+    g_score = {start: 0}
+    parent = {start: None}
+    h_cache = {start: heuristic_fn(start)}
+    open_set = {start}
+    incons = set()     # improved after being expanded in the current pass
+    closed = set()
+    open_heap = []
+    goal, goal_g = None, math.inf
+    last = None
+
+    def rebuild_heap():
+        nonlocal counter
+        open_heap.clear()
+        for s in open_set:
+            open_heap.append((g_score[s] + weight * h_cache[s], counter, s))
+            counter += 1
+        open_heap.sort()
+
+    def min_open_f():
+        # drop entries whose node left OPEN or whose g has since improved
+        while open_heap:
+            f, _, s = open_heap[0]
+            if s in open_set and f == g_score[s] + weight * h_cache[s]:
+                return f
+            heappop(open_heap)
+        return math.inf
+
+    rebuild_heap()
+    while True:
+        # ImprovePath: expand until no open node can beat the current goal
+        timed_out = False
+        while goal_g > min_open_f():
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            _, _, current = heappop(open_heap)
+            open_set.discard(current)
+            closed.add(current)
+            for nb in neighbors_fn(current):
+                tentative_g = g_score[current] + g_cost_fn(current, nb)
+                if nb in g_score and tentative_g >= g_score[nb]:
+                    continue
+                g_score[nb] = tentative_g
+                parent[nb] = current
+                if nb not in h_cache:
+                    h_cache[nb] = heuristic_fn(nb)
+                if goal_test(nb):
+                    if tentative_g < goal_g:
+                        goal, goal_g = nb, tentative_g
+                    continue
+                if nb in closed:
+                    incons.add(nb)
+                else:
+                    open_set.add(nb)
+                    heappush(open_heap, (tentative_g + weight * h_cache[nb], counter, nb))
+                    counter += 1
+
+        if goal is None:
+            return
+        # every better path still runs through OPEN or INCONS, so this bound
+        # holds even when the pass was cut short by the deadline
+        lower = min((g_score[s] + h_cache[s] for s in open_set | incons), default=math.inf)
+        bound = goal_g / lower if lower > 0 else math.inf
+        if not timed_out:
+            bound = min(bound, weight)
+        bound = max(bound, 1.0)
+        if (goal_g, bound) != last:
+            last = (goal_g, bound)
+            # parents may have improved since the goal was reached, so the
+            # path can be a little cheaper than goal_g
+            path = reconstruct_path(parent, goal)
+            cost = sum(g_cost_fn(a, b) for a, b in zip(path, path[1:]))
+            yield path, cost, bound
+        if timed_out or bound <= 1 or weight <= 1:
+            return
+        weight = max(1.0, weight - weight_step)
+        open_set |= incons
+        incons.clear()
+        closed.clear()
+        rebuild_heap()
+
+
+# counters filled in by beam_search(..., stats={})
+BEAM_STAT_KEYS = (
+    'expansions',
+    'pushes',
+    'pruned',          # frontier entries / beam candidates thrown away
+    'peak_open',       # largest frontier (or candidate layer) kept between expansions
+    'goal_lost',       # 1 if the search failed after pruning anything, else 0
+)
+
+
+def beam_search(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+                beam_width=None, max_frontier=None, max_expansions=None, stats=None):
+    """
+    Pruned Greedy Best-First Search, for bounded memory and latency:
+    - beam_width: layered beam search. Every layer expands at most
+      beam_width nodes; of their children only the beam_width with the
+      lowest h are kept, the rest are pruned.
+    - max_frontier (without beam_width): best_first() whose open heap
+      never holds more than max_frontier entries between expansions: when
+      an expansion overfills it, it is cut back to the lowest-h half
+      (which keeps the trimming amortized O(1) per push), and dropped
+      nodes are forgotten.
+    - max_expansions: give up after that many expansions; the frontier
+      left over counts as pruned.
+    - With none set this behaves like best_first().
+    The caps bound the frontier only. g/parent entries are kept for every
+    expanded node (paths are rebuilt from them), so memory grows with the
+    expansions: O(frontier + expansions * branching). max_expansions bounds
+    that, and the time, for real.
+    Incomplete: pruning can throw away every route to the goal. A failed
+    search that pruned anything reports goal_lost = 1 in stats (see
+    BEAM_STAT_KEYS), so StatsSummary(BEAM_STAT_KEYS).mean('goal_lost') is
+    the fraction of queries lost to pruning.
+    Returns (path, cost) or (None, inf) if no path was found.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(dict.fromkeys(BEAM_STAT_KEYS, 0))
+    stats['peak_open'] = 1
+    if beam_width is not None:
+        result = _beam_layers(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+                              beam_width, max_expansions, stats)
+    else:
+        result = _bounded_best_first(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+                                     max_frontier, max_expansions, stats)
+    if result[0] is None and stats['pruned']:
+        stats['goal_lost'] = 1
+    return result
+
+
+def _beam_layers(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, beam_width,
+                 max_expansions, stats):
+    budget = math.inf if max_expansions is None else max_expansions
+    counter = 0
+    g_score = {start: 0}
+    parent = {start: None}
+    layer = [start]
+
+    while layer:
+        candidates = {}    # child -> (g, parent), cheapest g from this layer
+        for k, current in enumerate(layer):
+            if goal_test(current):
+                return reconstruct_path(parent, current), g_score[current]
+            if stats['expansions'] >= budget:
+                stats['pruned'] += len(layer) - k + len(candidates)
+                return None, math.inf
+            stats['expansions'] += 1
+            for nb in neighbors_fn(current):
+                if nb in g_score:
+                    continue    # already kept in an earlier layer
+                tentative_g = g_score[current] + g_cost_fn(current, nb)
+                best = candidates.get(nb)
+                if best is None or tentative_g < best[0]:
+                    candidates[nb] = (tentative_g, current)
+
+        ranked = []
+        for nb in candidates:
+            ranked.append((heuristic_fn(nb), counter, nb))
+            counter += 1
+        stats['pushes'] += len(ranked)
+        if len(ranked) > stats['peak_open']:
+            stats['peak_open'] = len(ranked)
+        if len(ranked) > beam_width:
+            stats['pruned'] += len(ranked) - beam_width
+            ranked = nsmallest(beam_width, ranked)
+        else:
+            ranked.sort()
+
+        layer = []
+        for _, _, nb in ranked:
+            g_score[nb], parent[nb] = candidates[nb]
+            layer.append(nb)
+
+    return None, math.inf
+
+
+def _bounded_best_first(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+                        max_frontier, max_expansions, stats):
+    if goal_test(start):
+        return [start], 0
+
+    limit = math.inf if max_frontier is None else max_frontier
+    keep = None if max_frontier is None else max(1, max_frontier // 2)
+    budget = math.inf if max_expansions is None else max_expansions
+    open_heap = []
+    counter = 0
+    parent = {start: None}
+    g_score = {start: 0}
+    heappush(open_heap, (heuristic_fn(start), counter, start))
+    counter += 1
+    closed = set()
+
+    while open_heap:
+        h, _, current = heappop(open_heap)
+        if current in closed:
+            continue
+        if goal_test(current):
+            return reconstruct_path(parent, current), g_score[current]
+        if stats['expansions'] >= budget:
+            stats['pruned'] += 1 + sum(1 for _, _, s in open_heap if s not in closed)
+            return None, math.inf
+        closed.add(current)
+        stats['expansions'] += 1
+
+        for nb in neighbors_fn(current):
+            tentative_g = g_score[current] + g_cost_fn(current, nb)
+            if nb not in g_score or tentative_g < g_score[nb]:
+                g_score[nb] = tentative_g
+                parent[nb] = current
+                heappush(open_heap, (heuristic_fn(nb), counter, nb))
+                counter += 1
+                stats['pushes'] += 1
+
+        if len(open_heap) > limit:
+            # stale entries of closed nodes go first; a sorted list is a valid heap
+            live = [entry for entry in open_heap if entry[2] not in closed]
+            kept = nsmallest(keep, live)
+            stats['pruned'] += len(live) - len(kept)
+            alive = {entry[2] for entry in kept}
+            for _, _, s in live:
+                if s not in alive and s in g_score:
+                    del g_score[s]
+                    del parent[s]
+            open_heap = kept
+        if len(open_heap) > stats['peak_open']:
+            stats['peak_open'] = len(open_heap)
+
+    return None, math.inf
+
+
 # simple helper for unit distance
 def unit_cost(a, b):
     return 1
@@ -194,6 +917,7 @@ if __name__ == '__main__':
 
 
 
+"""
 Quick example to test (manual input)
 
 For a 5×5 grid with a few walls, try these inputs when the program asks:
@@ -209,3 +933,4 @@ Enter start coordinates x,y: → 0,0
 Enter goal coordinates x,y: → 4,4
 
 You’ll see both algorithms’ paths and costs printed. Often A* will give a shorter path; Best-First may take a different (not optimal) path.
+"""
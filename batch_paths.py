@@ -0,0 +1,128 @@
+from multiprocessing import Pool, shared_memory
+import os
+import time
+
+from aastar import BitmapGrid, astar, open_cells, random_grid, unit_cost
+
+
+# Batch path queries spread over worker processes. The grid's occupancy is
+# copied into one shared-memory block; every worker maps the same block, so
+# the map is neither pickled per query nor duplicated per process.
+
+_worker_grid = None
+_worker_shm = None
+
+
+def _attach(name, width, height):
+    global _worker_grid, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=name)
+    _worker_grid = BitmapGrid(width, height, cells=_worker_shm.buf[:width * height])
+
+
+def _solve(query):
+    start, goal, detailed = query
+    grid = _worker_grid
+    # detailed stats time every callback, which roughly doubles the cost of a
+    # query; by default only count expansions through the neighbor callback
+    stats = {}
+    expansions = 0
+    def neighbors(s):
+        nonlocal expansions
+        expansions += 1
+        return grid.neighbors(s)
+
+    t0 = time.perf_counter()
+    path, cost = astar(start,
+                       lambda s: s == goal,
+                       grid.neighbors if detailed else neighbors,
+                       unit_cost,
+                       lambda s: grid.manhattan(s, goal),
+                       stats=stats if detailed else None)
+    stats.setdefault('expansions', expansions)
+    stats['time'] = time.perf_counter() - t0
+    stats['pid'] = os.getpid()
+    return path, cost, stats
+
+
+class BatchPlanner:
+    """
+    Runs many independent (start, goal) astar() queries in a process pool.
+
+        with BatchPlanner(grid, workers=8) as planner:
+            results = planner.run(queries)   # [(path, cost, stats), ...] in input order
+
+    stats holds the query's expansions, wall time and worker pid; with
+    detailed=True it is the full astar(..., stats=...) dict plus those.
+    After changing walls on the original grid call refresh() so the workers
+    see the new map; the pool itself is kept.
+    """
+    def __init__(self, grid, workers=None):
+        self.grid = grid
+        self.w, self.h = grid.w, grid.h
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, self.w * self.h))
+        self.refresh()
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = Pool(self.workers, initializer=_attach,
+                         initargs=(self.shm.name, self.w, self.h))
+
+    def refresh(self):
+        """Copy the grid's current walls into shared memory."""
+        n = self.w * self.h
+        if isinstance(self.grid, BitmapGrid):
+            self.shm.buf[:n] = bytes(self.grid.cells)
+        else:
+            self.shm.buf[:n] = bytes(BitmapGrid(self.w, self.h, self.grid.walls).cells)
+
+    def run(self, queries, detailed=False, chunksize=None):
+        queries = [(start, goal, detailed) for start, goal in queries]
+        if chunksize is None:
+            # a few chunks per worker keeps them busy without much IPC
+            chunksize = max(1, len(queries) // (self.workers * 4))
+        return self.pool.map(_solve, queries, chunksize=chunksize)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def batch_astar(grid, queries, workers=None, detailed=False):
+    """One-shot helper: [(path, cost, stats), ...] for queries, in input order."""
+    with BatchPlanner(grid, workers) as planner:
+        return planner.run(queries, detailed)
+
+
+if __name__ == '__main__':
+    import random
+
+    size = 300
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng, BitmapGrid)
+    free = open_cells(grid)
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(200)]
+
+    t0 = time.perf_counter()
+    serial = []
+    for start, goal in queries:
+        _, cost = astar(start, lambda p: p == goal, grid.neighbors, unit_cost,
+                        lambda p: grid.manhattan(p, goal))
+        serial.append(cost)
+    baseline = time.perf_counter() - t0
+    print(f'serial: {baseline:.2f}s')
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with BatchPlanner(grid, workers) as planner:
+            t0 = time.perf_counter()
+            results = planner.run(queries)
+            elapsed = time.perf_counter() - t0
+        assert [cost for _, cost, _ in results] == serial
+        print(f'{workers} worker(s): {elapsed:.2f}s, speed-up {baseline / elapsed:.1f}x')
+        workers *= 2
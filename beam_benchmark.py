@@ -0,0 +1,58 @@
+# Benchmark: beam_search() at several beam widths / frontier / expansion
+# caps against best_first() on the same random grid queries. Reports mean
+# expansions, peak frontier, time, path cost and how often pruning lost the
+# goal. The second map is close to the percolation threshold: its dead ends
+# make greedy search back up, so small frontier caps start to cost queries.
+
+import random
+import sys
+import time
+
+from aastar import (BEAM_STAT_KEYS, StatsSummary, astar, beam_search, open_cells, random_grid,
+                    unit_cost)
+
+
+def run(size=150, density=0.3, queries=40, seed=1,
+        widths=(4, 16, 64), caps=(4, 16, 64, 256), budgets=(100, 400)):
+    rng = random.Random(seed)
+    grid = random_grid(size, density, rng)
+    free = open_cells(grid)
+    pairs = []
+    while len(pairs) < queries:
+        start, goal = rng.choice(free), rng.choice(free)
+        # only reachable pairs, so every failure is a goal lost to pruning
+        if astar(start, lambda s: s == goal, grid.neighbors, unit_cost,
+                 lambda s: grid.manhattan(s, goal))[0] is not None:
+            pairs.append((start, goal))
+
+    configs = [('best_first', {})]
+    configs += [(f'beam {w}', {'beam_width': w}) for w in widths]
+    configs += [(f'frontier {c}', {'max_frontier': c}) for c in caps]
+    configs += [(f'expansions {b}', {'max_expansions': b}) for b in budgets]
+
+    print(f'{size}x{size} grid, {density:.0%} walls, {queries} reachable queries')
+    print(f'{"search":<16}{"expansions":>12}{"peak open":>11}{"time (s)":>10}'
+          f'{"mean cost":>11}{"lost":>7}')
+    for name, options in configs:
+        summary = StatsSummary(BEAM_STAT_KEYS)
+        costs = []
+        t0 = time.perf_counter()
+        for start, goal in pairs:
+            stats = {}
+            # no options: unpruned, same pops as best_first(), counted the same way
+            _, cost = beam_search(start, lambda s: s == goal, grid.neighbors, unit_cost,
+                                  lambda s: grid.manhattan(s, goal), stats=stats, **options)
+            summary.add(stats)
+            if cost != float('inf'):
+                costs.append(cost)
+        elapsed = time.perf_counter() - t0
+        mean_cost = sum(costs) / len(costs) if costs else float('inf')
+        print(f'{name:<16}{summary.mean("expansions"):>12.1f}{summary.maxima["peak_open"]:>11}'
+              f'{elapsed:>10.3f}{mean_cost:>11.1f}{summary.mean("goal_lost"):>7.0%}')
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    run(size=size)
+    print()
+    run(size=size, density=0.38)
@@ -0,0 +1,58 @@
+# Benchmark: astar() vs bidirectional_astar() on the same random grid queries.
+# Expansions are counted by wrapping the neighbor callbacks, so neither
+# search needs to know it is being measured.
+
+import random
+import sys
+import time
+
+from aastar import astar, bidirectional_astar, open_cells, random_grid, unit_cost
+
+
+class CountingNeighbors:
+    """Wraps a neighbors function and counts how many nodes it expanded."""
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, s):
+        self.calls += 1
+        return self.fn(s)
+
+
+def run(size=200, density=0.25, queries=30, seed=1):
+    rng = random.Random(seed)
+    grid = random_grid(size, density, rng)
+    free = open_cells(grid)
+
+    totals = {'astar': [0, 0.0], 'bidirectional': [0, 0.0]}
+    for _ in range(queries):
+        start, goal = rng.choice(free), rng.choice(free)
+
+        nb = CountingNeighbors(grid.neighbors)
+        t0 = time.perf_counter()
+        _, cost_a = astar(start, lambda s: s == goal, nb, unit_cost,
+                          lambda s: grid.manhattan(s, goal))
+        totals['astar'][0] += nb.calls
+        totals['astar'][1] += time.perf_counter() - t0
+
+        nb = CountingNeighbors(grid.neighbors)
+        t0 = time.perf_counter()
+        _, cost_b = bidirectional_astar(start, goal, nb, unit_cost,
+                                        lambda s: grid.manhattan(s, goal),
+                                        lambda s: grid.manhattan(s, start))
+        totals['bidirectional'][0] += nb.calls
+        totals['bidirectional'][1] += time.perf_counter() - t0
+
+        if cost_a != cost_b:
+            raise AssertionError(f'cost mismatch for {start}->{goal}: {cost_a} vs {cost_b}')
+
+    print(f'{size}x{size} grid, {density:.0%} walls, {queries} queries')
+    print(f'{"search":<15}{"expansions":>12}{"time (s)":>12}')
+    for name, (expansions, elapsed) in totals.items():
+        print(f'{name:<15}{expansions:>12}{elapsed:>12.3f}')
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    run(size=size)
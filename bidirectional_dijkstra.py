@@ -0,0 +1,130 @@
+from heapq import heappush, heappop
+
+from dijkstra_engine import INF, reverse_adjacency
+
+
+class BidirectionalDijkstra:
+    """
+    Point-to-point Dijkstra searching forward from start and backward from
+    end at the same time, on the {node: [(neighbor, weight), ...]} format.
+
+    The reverse adjacency is built once in the constructor and shared by
+    every query(). The frontiers take turns settling one node each, and the
+    search stops once the two heap minima add up to at least the best
+    start -> end distance seen through any edge joining them, mu: no
+    unexplored path can be shorter. settled counts the nodes settled by the
+    last query.
+    """
+    def __init__(self, graph):
+        self.graph = graph
+        self.reverse = reverse_adjacency(graph)
+        self.settled = 0
+
+    def query(self, start, end):
+        """
+        Returns (distance, path) like dijkstra() + get_path(): (inf, []) if
+        unreachable. The distance is always identical; among equally short
+        paths the one returned may differ.
+        """
+        self.settled = 0
+        if start == end:
+            return 0, [start]
+
+        dist = ({start: 0}, {end: 0})
+        parent = ({start: None}, {end: None})
+        done = (set(), set())
+        heaps = ([(0, 0, start)], [(0, 0, end)])
+        adjacency = (self.graph, self.reverse)
+        counter = 1
+        mu, meet = INF, None
+        side = 0
+
+        while True:
+            # drop entries for nodes already settled on their side
+            for s in (0, 1):
+                heap = heaps[s]
+                while heap and heap[0][2] in done[s]:
+                    heappop(heap)
+            if not heaps[0] or not heaps[1]:
+                break
+            if heaps[0][0][0] + heaps[1][0][0] >= mu:
+                break
+
+            d, _, node = heappop(heaps[side])
+            done[side].add(node)
+            self.settled += 1
+            own, other = dist[side], dist[1 - side]
+            for neighbor, weight in adjacency[side].get(node, ()):
+                if neighbor in done[side]:
+                    continue
+                new_dist = d + weight
+                if new_dist < own.get(neighbor, INF):
+                    own[neighbor] = new_dist
+                    parent[side][neighbor] = node
+                    heappush(heaps[side], (new_dist, counter, neighbor))
+                    counter += 1
+                if neighbor in other and own[neighbor] + other[neighbor] < mu:
+                    mu = own[neighbor] + other[neighbor]
+                    meet = neighbor
+            side = 1 - side
+
+        if meet is None:
+            return INF, []
+        path = []
+        node = meet
+        while node is not None:
+            path.append(node)
+            node = parent[0][node]
+        path.reverse()
+        node = parent[1][meet]
+        while node is not None:
+            path.append(node)
+            node = parent[1][node]
+        return self._path_cost(path), path
+
+    def _path_cost(self, path):
+        # summed left to right like dijkstra() does, so float totals match exactly
+        total = 0
+        for a, b in zip(path, path[1:]):
+            total += min(w for n, w in self.graph[a] if n == b)
+        return total
+
+
+def bidirectional_dijkstra(graph, start, end):
+    """One-off query; build a BidirectionalDijkstra to reuse the reverse graph."""
+    return BidirectionalDijkstra(graph).query(start, end)
+
+
+if __name__ == '__main__':
+    import random
+    import sys
+    import time
+
+    from dijkstra import dijkstra, get_path
+    from dijkstra_benchmark import random_graph
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(3)
+    graph = random_graph(n, 3, 10, rng)
+    engine = BidirectionalDijkstra(graph)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(20)]
+
+    t_uni = t_bi = 0.0
+    settled_uni = settled_bi = 0
+    for start, end in pairs:
+        t0 = time.perf_counter()
+        distances, previous, state = dijkstra(graph, start, target=end)
+        expected = (distances[end], get_path(previous, start, end))
+        t1 = time.perf_counter()
+        got = engine.query(start, end)
+        t2 = time.perf_counter()
+        if got[0] != expected[0]:
+            raise AssertionError(f'{start} -> {end}: {got[0]} vs {expected[0]}')
+        t_uni += t1 - t0
+        t_bi += t2 - t1
+        settled_uni += len(state.distances)
+        settled_bi += engine.settled
+
+    print(f'{len(pairs)} queries on V={n}')
+    print(f'dijkstra(target=):  {t_uni:.3f}s, {settled_uni / len(pairs):.0f} nodes settled per query')
+    print(f'bidirectional:      {t_bi:.3f}s, {settled_bi / len(pairs):.0f} nodes settled per query')
@@ -0,0 +1,396 @@
+from array import array
+from heapq import heappush, heappop
+
+from dijkstra_engine import INF
+
+
+# Contraction Hierarchies for static graphs in the dijkstra.py format
+# {node: [(neighbor, weight), ...]}, weights non-negative.
+#
+# Preprocessing contracts nodes one at a time, least important first. When
+# v is contracted, every path u -> v -> x that may be the only shortest
+# u -> x path gets a shortcut edge u -> x remembering v as its middle node.
+# A bounded "witness" Dijkstra from u that avoids v decides whether some
+# other path is at least as short, in which case no shortcut is needed.
+# The contraction order is the node rank. A query then only ever climbs:
+# forward search from s on edges to higher ranks, backward search from t
+# on reversed edges to higher ranks, and the two meet at the top.
+#
+# Everything is kept in CSR arrays indexed by node id:
+#   up_*   edges v -> x with rank[x] > rank[v], for the forward search
+#   down_* edges u -> v with rank[u] > rank[v], stored at v (backward search)
+# *_middle is the contracted node of a shortcut, or -1 for an original edge.
+
+
+class ContractionHierarchy:
+    """
+    Query engine over a contraction hierarchy; build() or load() one, then
+    distance(s, t) or path(s, t). settled counts the nodes settled by the
+    last query.
+    """
+    def __init__(self, nodes, rank, up, down):
+        self.nodes = list(nodes)
+        self.index = {n: i for i, n in enumerate(self.nodes)}
+        self.rank = rank
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middle = up
+        self.down_offsets, self.down_targets, self.down_weights, self.down_middle = down
+        self.settled = 0
+
+    @property
+    def shortcuts(self):
+        return (sum(1 for m in self.up_middle if m >= 0)
+                + sum(1 for m in self.down_middle if m >= 0))
+
+    # ---------- preprocessing ----------
+
+    @classmethod
+    def build(cls, graph, witness_limit=100):
+        """
+        Contracts graph in edge-difference order with lazy priority updates.
+        witness_limit caps the nodes settled per witness search: a search
+        cut short just adds a shortcut that was not strictly needed, so
+        queries stay exact while preprocessing stays bounded.
+        """
+        nodes = list(graph)
+        index = {n: i for i, n in enumerate(nodes)}
+        for edges in graph.values():
+            for neighbor, _ in edges:
+                if neighbor not in index:
+                    index[neighbor] = len(nodes)
+                    nodes.append(neighbor)
+        n = len(nodes)
+
+        # live graph of not-yet-contracted nodes, parallel edges collapsed
+        out = [{} for _ in range(n)]
+        inn = [{} for _ in range(n)]
+        for node, edges in graph.items():
+            u = index[node]
+            for neighbor, weight in edges:
+                x = index[neighbor]
+                if x != u and weight < out[u].get(x, INF):
+                    out[u][x] = weight
+                    inn[x][u] = weight
+        middle = {}    # (u, x) -> contracted node, for shortcut edges
+
+        def witness(u, v, limit_dist):
+            """Distances from u avoiding v, up to limit_dist or witness_limit settled nodes."""
+            dist = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < witness_limit:
+                d, a = heappop(heap)
+                if d > dist[a]:
+                    continue
+                if d > limit_dist:
+                    break
+                settled += 1
+                for b, w in out[a].items():
+                    if b == v:
+                        continue
+                    nd = d + w
+                    if nd < dist.get(b, INF):
+                        dist[b] = nd
+                        heappush(heap, (nd, b))
+            return dist
+
+        def shortcuts_for(v):
+            needed = []
+            for u, w_uv in inn[v].items():
+                candidates = [(x, w_uv + w_vx) for x, w_vx in out[v].items() if x != u]
+                if not candidates:
+                    continue
+                dist = witness(u, v, max(d for _, d in candidates))
+                for x, d in candidates:
+                    if dist.get(x, INF) > d:
+                        needed.append((u, x, d))
+            return needed
+
+        deleted = [0] * n    # contracted neighbors, spreads contraction evenly
+
+        def priority(v):
+            return len(shortcuts_for(v)) - len(inn[v]) - len(out[v]) + deleted[v]
+
+        heap = [(priority(v), v) for v in range(n)]
+        heap.sort()
+        rank = array('q', bytes(8 * n))
+        up_lists = [None] * n
+        down_lists = [None] * n
+        order = 0
+        while heap:
+            _, v = heappop(heap)
+            # lazy update: re-check v's priority against the next candidate
+            p = priority(v)
+            if heap and p > heap[0][0]:
+                heappush(heap, (p, v))
+                continue
+
+            for u, x, d in shortcuts_for(v):
+                if d < out[u].get(x, INF):
+                    out[u][x] = d
+                    inn[x][u] = d
+                    middle[(u, x)] = v
+            up_lists[v] = [(x, w, middle.get((v, x), -1)) for x, w in out[v].items()]
+            down_lists[v] = [(u, w, middle.get((u, v), -1)) for u, w in inn[v].items()]
+            for u in inn[v]:
+                del out[u][v]
+                deleted[u] += 1
+            for x in out[v]:
+                del inn[x][v]
+                deleted[x] += 1
+            out[v] = inn[v] = None
+            rank[v] = order
+            order += 1
+
+        typecode = _weight_typecode(up_lists + down_lists)
+        return cls(nodes, rank, _csr(up_lists, typecode), _csr(down_lists, typecode))
+
+    # ---------- queries ----------
+
+    def _search(self, s, t):
+        """Bidirectional upward search; returns (distance, meet, fwd parents, bwd parents)."""
+        up_off, up_tgt, up_w = self.up_offsets, self.up_targets, self.up_weights
+        dn_off, dn_tgt, dn_w = self.down_offsets, self.down_targets, self.down_weights
+        df, db = {s: 0}, {t: 0}
+        pf, pb = {s: -1}, {t: -1}
+        hf, hb = [(0, s)], [(0, t)]
+        best, meet = (0, s) if s == t else (INF, -1)
+        settled = 0
+
+        while hf or hb:
+            # each side stops once it cannot improve best any more
+            if hf and hf[0][0] >= best:
+                hf = []
+            if hb and hb[0][0] >= best:
+                hb = []
+            if hf and (not hb or hf[0][0] <= hb[0][0]):
+                d, v = heappop(hf)
+                if d > df[v]:
+                    continue
+                settled += 1
+                other = db.get(v)
+                if other is not None and d + other < best:
+                    best, meet = d + other, v
+                for k in range(up_off[v], up_off[v + 1]):
+                    x = up_tgt[k]
+                    nd = d + up_w[k]
+                    if nd < df.get(x, INF):
+                        df[x] = nd
+                        pf[x] = v
+                        heappush(hf, (nd, x))
+            elif hb:
+                d, v = heappop(hb)
+                if d > db[v]:
+                    continue
+                settled += 1
+                other = df.get(v)
+                if other is not None and d + other < best:
+                    best, meet = d + other, v
+                for k in range(dn_off[v], dn_off[v + 1]):
+                    x = dn_tgt[k]
+                    nd = d + dn_w[k]
+                    if nd < db.get(x, INF):
+                        db[x] = nd
+                        pb[x] = v
+                        heappush(hb, (nd, x))
+        self.settled = settled
+        return best, meet, pf, pb
+
+    def distance(self, start, end):
+        """Shortest start -> end distance, inf if unreachable or unknown."""
+        s, t = self.index.get(start), self.index.get(end)
+        if s is None or t is None:
+            return INF
+        return self._search(s, t)[0]
+
+    def path(self, start, end):
+        """Returns (distance, path) like dijkstra() + get_path(): (inf, []) if unreachable."""
+        s, t = self.index.get(start), self.index.get(end)
+        if s is None or t is None:
+            return INF, []
+        best, meet, pf, pb = self._search(s, t)
+        if best == INF:
+            return INF, []
+        ids = []
+        v = meet
+        while v != -1:
+            ids.append(v)
+            v = pf[v]
+        ids.reverse()
+        v = pb[meet]
+        while v != -1:
+            ids.append(v)
+            v = pb[v]
+
+        full = [ids[0]]
+        total = 0
+        for a, b in zip(ids, ids[1:]):
+            total = self._unpack(a, b, full, total)
+        return total, [self.nodes[i] for i in full]
+
+    def _edge(self, a, b):
+        """(weight, middle) of the hierarchy edge a -> b."""
+        if self.rank[a] < self.rank[b]:
+            off, tgt, w, mid, at, other = (self.up_offsets, self.up_targets,
+                                           self.up_weights, self.up_middle, a, b)
+        else:
+            off, tgt, w, mid, at, other = (self.down_offsets, self.down_targets,
+                                           self.down_weights, self.down_middle, b, a)
+        for k in range(off[at], off[at + 1]):
+            if tgt[k] == other:
+                return w[k], mid[k]
+        raise KeyError((self.nodes[a], self.nodes[b]))
+
+    def _unpack(self, a, b, out, total):
+        # explicit stack: shortcuts of shortcuts can nest deeply
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            weight, m = self._edge(a, b)
+            if m < 0:
+                out.append(b)
+                total += weight    # summed left to right like dijkstra()
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+        return total
+
+    # ---------- serialization ----------
+
+    def save(self, path):
+        """
+        Writes rank and both CSR halves as raw arrays after a small header
+        (which also records whether the weights are int64 or float64);
+        node labels go in a sidecar .nodes file, like Landmarks.save().
+        """
+        if not isinstance(self.up_weights, array):
+            raise ValueError('weights do not fit in int64 and cannot be saved')
+        with open(path, 'wb') as f:
+            int_weights = self.up_weights.typecode == 'q'
+            array('q', [len(self.nodes), len(self.up_targets), len(self.down_targets),
+                        int(int_weights)]).tofile(f)
+            self.rank.tofile(f)
+            for arr in (self.up_offsets, self.up_targets, self.up_weights, self.up_middle,
+                        self.down_offsets, self.down_targets, self.down_weights, self.down_middle):
+                arr.tofile(f)
+        with open(path + '.nodes', 'w', encoding='utf-8') as f:
+            f.write('\n'.join(map(repr, self.nodes)))
+
+    @classmethod
+    def load(cls, path, nodes=None):
+        """Reads a file written by save(); pass nodes (same order) to skip the .nodes file."""
+        if nodes is None:
+            from ast import literal_eval
+            with open(path + '.nodes', encoding='utf-8') as f:
+                nodes = [literal_eval(line) for line in f.read().splitlines()]
+        with open(path, 'rb') as f:
+            header = array('q')
+            header.fromfile(f, 4)
+            n, m_up, m_down, int_weights = header
+            wt = 'q' if int_weights else 'd'
+            if n != len(nodes):
+                raise ValueError(f'hierarchy has {n} nodes, got {len(nodes)}')
+
+            def read(typecode, count):
+                arr = array(typecode)
+                arr.fromfile(f, count)
+                return arr
+
+            rank = read('q', n)
+            up = (read('q', n + 1), read('q', m_up), read(wt, m_up), read('q', m_up))
+            down = (read('q', n + 1), read('q', m_down), read(wt, m_down), read('q', m_down))
+        return cls(nodes, rank, up, down)
+
+
+def _weight_typecode(lists):
+    """
+    'q' when every weight (shortcuts included) is an int that fits int64,
+    'd' when any weight is not an int, and None (a plain list) for ints
+    too big for int64, so integer graphs always come back exact.
+    """
+    typecode = 'q'
+    for edges in lists:
+        for _, w, _ in edges:
+            if type(w) is not int:
+                return 'd'
+            if not -2**63 <= w < 2**63:
+                typecode = None
+    return typecode
+
+
+def _csr(lists, typecode):
+    offsets = array('q', [0])
+    targets, weights, middles = array('q'), array(typecode) if typecode else [], array('q')
+    for edges in lists:
+        for x, w, m in edges:
+            targets.append(x)
+            weights.append(w)
+            middles.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
+
+
+if __name__ == '__main__':
+    import os
+    import random
+    import sys
+    import tempfile
+    import time
+
+    from dijkstra import dijkstra
+
+    # road-like graph: a jittered 2D lattice with a few long edges, both directions
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    rng = random.Random(1)
+    graph = {(x, y): [] for x in range(side) for y in range(side)}
+    def link(a, b, w):
+        graph[a].append((b, w))
+        graph[b].append((a, w))
+    for x in range(side):
+        for y in range(side):
+            if x + 1 < side:
+                link((x, y), (x + 1, y), rng.randint(1, 10))
+            if y + 1 < side:
+                link((x, y), (x, y + 1), rng.randint(1, 10))
+    for _ in range(side):
+        a = (rng.randrange(side), rng.randrange(side))
+        b = (rng.randrange(side), rng.randrange(side))
+        if a != b:
+            link(a, b, rng.randint(5, 40))
+
+    t0 = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    t1 = time.perf_counter()
+    edges = sum(len(e) for e in graph.values())
+    print(f'{len(graph)} nodes, {edges} edges: built in {t1 - t0:.2f}s, {ch.shortcuts} shortcuts')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'graph.ch')
+        ch.save(path)
+        size = os.path.getsize(path)
+        ch = ContractionHierarchy.load(path)
+    print(f'saved and reloaded: {size / 1024:.0f} KiB')
+
+    nodes = list(graph)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(200)]
+    t_dij = t_ch = 0.0
+    settled = 0
+    for s, t in pairs:
+        t0 = time.perf_counter()
+        distances, previous, _ = dijkstra(graph, s, target=t)
+        expected = distances[t]
+        t1 = time.perf_counter()
+        got, path = ch.path(s, t)
+        t2 = time.perf_counter()
+        if got != expected or type(got) is not type(expected) or path[0] != s or path[-1] != t:
+            raise AssertionError(f'{s} -> {t}: {got} vs {expected}')
+        t_dij += t1 - t0
+        t_ch += t2 - t1
+        settled += ch.settled
+    t0 = time.perf_counter()
+    for s, t in pairs:
+        ch.distance(s, t)
+    t_dist = time.perf_counter() - t0
+    q = len(pairs)
+    print(f'dijkstra(target=): {t_dij / q * 1e6:8.0f} us per query')
+    print(f'CH distance():     {t_dist / q * 1e6:8.0f} us per query, {settled / q:.0f} nodes settled')
+    print(f'CH path():         {t_ch / q * 1e6:8.0f} us per query')
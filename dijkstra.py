@@ -1,13 +1,42 @@
 # Dijkstra's Algorithm - Single Source Shortest Path Algorithm
 # Find shortest path from source to all other nodes in weighted graph
 
-def dijkstra(graph, start):
+from dijkstra_engine import DijkstraSearch, dijkstra_search
+
+def dijkstra(graph, start, target=None, targets=None, state=None, queue='auto'):
     """
     Dijkstra's Shortest Path Algorithm Implementation
     graph: adjacency list {node: [(neighbor, weight), ...]}
     start: starting node (source vertex)
     Returns: dictionary of shortest distances and predecessor paths
+    Runs on the shared heap-based engine in O((V+E) log V); the O(V^2)
+    version below is kept as dijkstra_quadratic() for reference.
+
+    Point-to-point mode: pass target (one node) or targets (several) to stop
+    as soon as they are settled. Returns (distances, previous, state), where
+    the maps cover the settled nodes only (unreachable targets get inf) and
+    state is the paused search. Pass state back for another query from the
+    same start and it resumes where it stopped instead of starting over.
+
+    queue: 'auto' lets a full search pick a bucket queue for integer weights
+    from a scan of the edges (see select_queue). An early exit skips that
+    O(E) scan and keeps the binary heap, so pass queue=select_queue(graph),
+    computed once when the graph is loaded, to use buckets there too.
     """
+    if target is None and targets is None and state is None:
+        return dijkstra_search(graph, start, queue)
+
+    if state is None:
+        state = DijkstraSearch(graph, start, None if queue == 'auto' else queue)
+    elif state.start != start or state.graph is not graph:
+        raise ValueError("state belongs to a search from another start or graph")
+    if target is not None:
+        targets = [target]
+    state.run(targets)
+    return state.distances, state.previous, state
+
+def dijkstra_quadratic(graph, start):
+    """Original O(V^2) version: picks the closest unvisited node with min() every round"""
     # Get all nodes in the graph for initialization
     nodes = set(graph.keys())
     
@@ -63,28 +92,29 @@ def get_path(previous, start, end):
     # Return path only if it starts with source (i.e., end is reachable from start)
     return path if path[0] == start else []
 
-# Example weighted graph represented as adjacency list
-# Each node maps to list of (neighbor, weight) tuples
-graph = {
-    'A': [('B', 4), ('C', 2)],      # A connects to B(weight=4), C(weight=2)
-    'B': [('C', 1), ('D', 5)],      # B connects to C(weight=1), D(weight=5)
-    'C': [('D', 8), ('E', 10)],     # C connects to D(weight=8), E(weight=10)
-    'D': [('E', 2), ('F', 6)],      # D connects to E(weight=2), F(weight=6)
-    'E': [('F', 3)],                # E connects to F(weight=3)
-    'F': []                         # F has no outgoing edges
-}
-
-start = 'A'  # Source vertex
-distances, previous = dijkstra(graph, start)
-
-print(f"Dijkstra's shortest paths from {start}:")
-print("=" * 50)
-for node in sorted(distances.keys()):
-    if distances[node] != float('inf'):
-        path = get_path(previous, start, node)
-        print(f"{start} -> {node}: distance = {distances[node]:2}, path = {' -> '.join(path)}")
-    else:
-        print(f"{start} -> {node}: UNREACHABLE")
+if __name__ == '__main__':
+    # Example weighted graph represented as adjacency list
+    # Each node maps to list of (neighbor, weight) tuples
+    graph = {
+        'A': [('B', 4), ('C', 2)],      # A connects to B(weight=4), C(weight=2)
+        'B': [('C', 1), ('D', 5)],      # B connects to C(weight=1), D(weight=5)
+        'C': [('D', 8), ('E', 10)],     # C connects to D(weight=8), E(weight=10)
+        'D': [('E', 2), ('F', 6)],      # D connects to E(weight=2), F(weight=6)
+        'E': [('F', 3)],                # E connects to F(weight=3)
+        'F': []                         # F has no outgoing edges
+    }
+
+    start = 'A'  # Source vertex
+    distances, previous = dijkstra(graph, start)
+
+    print(f"Dijkstra's shortest paths from {start}:")
+    print("=" * 50)
+    for node in sorted(distances.keys()):
+        if distances[node] != float('inf'):
+            path = get_path(previous, start, node)
+            print(f"{start} -> {node}: distance = {distances[node]:2}, path = {' -> '.join(path)}")
+        else:
+            print(f"{start} -> {node}: UNREACHABLE")
 
 # ============================================================================
 # DETAILED ALGORITHM EXPLANATION
@@ -0,0 +1,125 @@
+# Benchmark: the original O(V^2) Dijkstra scans vs the shared heap engine
+# on random sparse graphs of growing size, to show where the heap version
+# starts to win. Every run also checks that all versions agree.
+
+from functools import partial
+import random
+import sys
+import time
+
+from dijkstra import dijkstra, dijkstra_quadratic, get_path
+from dijkstra_engine import DIAL_MAX_WEIGHT, DialQueue, RadixHeap, dijkstra_search, select_queue
+from shortest_path import dijkstra_shortest_path, dijkstra_shortest_path_quadratic
+
+
+def random_graph(n, degree, max_weight, rng):
+    """Connected-ish directed graph: a random cycle plus extra random edges."""
+    nodes = list(range(n))
+    rng.shuffle(nodes)
+    graph = {node: [] for node in nodes}
+    for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+        graph[a].append((b, rng.randint(1, max_weight)))
+    for node in nodes:
+        for _ in range(degree - 1):
+            graph[node].append((rng.randrange(n), rng.randint(1, max_weight)))
+    return graph
+
+
+def best_time(fn, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def run(sizes=(10, 30, 100, 300, 1000, 3000), degree=4, max_weight=10, seed=1):
+    rng = random.Random(seed)
+    print(f'random graphs, out-degree {degree}, weights 1..{max_weight}')
+    print(f'{"V":>7}{"min() scan":>13}{"heap":>11}{"linear scan":>13}{"heap":>11}{"speedup":>9}')
+    for n in sizes:
+        graph = random_graph(n, degree, max_weight, rng)
+        start = next(iter(graph))
+        t_quad, (dist_q, _) = best_time(dijkstra_quadratic, graph, start)
+        # queue=None: the heap columns time the binary heap, not select_queue()'s pick
+        t_heap, (dist_h, _) = best_time(partial(dijkstra, queue=None), graph, start)
+        t_lin, dist_l = best_time(dijkstra_shortest_path_quadratic, graph, start)
+        t_sp, dist_s = best_time(partial(dijkstra_shortest_path, queue=None), graph, start)
+        if not dist_q == dist_h == dist_l == dist_s:
+            raise AssertionError(f'distance mismatch on V={n}')
+        print(f'{n:>7}{t_quad * 1000:>11.3f}ms{t_heap * 1000:>9.3f}ms'
+              f'{t_lin * 1000:>11.3f}ms{t_sp * 1000:>9.3f}ms{t_quad / t_heap:>8.1f}x')
+
+
+def run_point_to_point(n=50000, degree=3, max_weight=10, queries=20, seed=2):
+    """Full dijkstra() + get_path() per query vs early exit, fresh and resumed."""
+    rng = random.Random(seed)
+    graph = random_graph(n, degree, max_weight, rng)
+    start = next(iter(graph))
+    targets = [rng.randrange(n) for _ in range(queries)]
+
+    t0 = time.perf_counter()
+    expected = []
+    for target in targets:
+        distances, previous = dijkstra(graph, start)
+        expected.append((distances[target], get_path(previous, start, target)))
+    t_full = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    settled = 0
+    for target, want in zip(targets, expected):
+        distances, previous, state = dijkstra(graph, start, target=target)
+        settled += len(state.distances)
+        if (distances[target], get_path(previous, start, target)) != want:
+            raise AssertionError(f'early exit disagrees for target {target}')
+    t_early = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    state = None
+    for target, want in zip(targets, expected):
+        distances, previous, state = dijkstra(graph, start, target=target, state=state)
+        if distances[target] != want[0]:
+            raise AssertionError(f'resumed search disagrees for target {target}')
+    t_resumed = time.perf_counter() - t0
+
+    print(f'\n{queries} point-to-point queries from one source, V={n}')
+    print(f'full search each time: {t_full:.3f}s')
+    print(f'early exit:            {t_early:.3f}s ({settled / queries:.0f} nodes settled per query)')
+    print(f'early exit, resumed:   {t_resumed:.3f}s ({len(state.distances)} nodes settled in total)')
+
+
+def run_queues(sizes=(100, 2000, 100000), degree=4, max_weights=(10, 1000, 50000, 10 ** 6),
+               seed=3):
+    """Full searches with each priority-queue backend on integer weights."""
+    rng = random.Random(seed)
+    print(f'\nqueue backends, full search, out-degree {degree}')
+    print(f'{"V":>7}{"max weight":>11}{"heap":>10}{"dial":>10}{"radix":>10}   auto picks')
+    for n, max_weight in ((n, w) for n in sizes for w in max_weights):
+        graph = random_graph(n, degree, max_weight, rng)
+        start = next(iter(graph))
+        t_heap, (expected, _) = best_time(dijkstra_search, graph, start, None, repeat=1)
+        row = [t_heap]
+        backends = [partial(DialQueue, max_weight) if max_weight <= DIAL_MAX_WEIGHT else None,
+                    RadixHeap]
+        for queue in backends:
+            if queue is None:
+                row.append(None)
+                continue
+            elapsed, (distances, _) = best_time(dijkstra_search, graph, start, queue, repeat=1)
+            if distances != expected:
+                raise AssertionError(f'{queue} disagrees with the heap')
+            row.append(elapsed)
+        picked = select_queue(graph)
+        picked = getattr(picked, 'func', picked)
+        cells = ''.join(f'{t * 1000:>8.1f}ms' if t is not None else f'{"-":>10}' for t in row)
+        print(f'{n:>7}{max_weight:>11}{cells}   {picked.__name__ if picked else "heap"}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(sizes=tuple(int(a) for a in sys.argv[1:]))
+    else:
+        run()
+        run_point_to_point()
+        run_queues()
@@ -0,0 +1,251 @@
+from functools import partial
+from heapq import heappush, heappop
+
+
+# Priority-queue Dijkstra shared by dijkstra.py and shortest_path.py.
+# Graphs use the same adjacency-list shape as those scripts:
+#     {node: [(neighbor, weight), ...]}, weights non-negative.
+# O((V + E) log V): every improvement pushes a new heap entry and stale
+# entries are skipped when popped, instead of scanning all nodes for the
+# minimum every round. Integer-weighted graphs can swap the binary heap
+# for a bucket queue (DialQueue, RadixHeap); select_queue() picks one.
+
+INF = float('inf')
+
+# select_queue() picks Dial's buckets only when the ring (max weight + 1
+# buckets, allocated and walked by every search) is small next to the
+# graph: at most one bucket per DIAL_EDGES_PER_BUCKET edges, and never more
+# than DIAL_MAX_WEIGHT. Past that the walk over empty buckets costs more
+# than heapq saves (see dijkstra_benchmark.run_queues()).
+DIAL_EDGES_PER_BUCKET = 16
+DIAL_MAX_WEIGHT = 1 << 16
+
+
+class DialQueue:
+    """
+    Dial's bucket queue for integer weights 0..max_weight: a ring of
+    max_weight + 1 buckets. Dijkstra's keys only grow and every pending key
+    lies within max_weight of the last one popped, so bucket d % size holds
+    exactly the entries with key d and pop() just walks the ring forward.
+    """
+    def __init__(self, max_weight):
+        self.size = max_weight + 1
+        self.buckets = [[] for _ in range(self.size)]
+        self.cursor = 0
+        self.count = 0
+
+    def push(self, d, node):
+        self.buckets[d % self.size].append((d, node))
+        self.count += 1
+
+    def pop(self):
+        """Returns (d, node) with the smallest d, or None when empty."""
+        if not self.count:
+            return None
+        buckets, size = self.buckets, self.size
+        c = self.cursor
+        while not buckets[c % size]:
+            c += 1
+        self.cursor = c
+        self.count -= 1
+        return buckets[c % size].pop()
+
+
+class RadixHeap:
+    """
+    Monotone radix heap for non-negative integer keys. Entry keys are
+    bucketed by the highest bit in which they differ from the last key
+    popped; pop() empties the lowest non-empty bucket into lower ones only
+    when bucket 0 runs dry, so each entry moves at most log2(max key) times.
+    """
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.count = 0
+
+    def push(self, d, node):
+        self.buckets[(d ^ self.last).bit_length()].append((d, node))
+        self.count += 1
+
+    def pop(self):
+        """Returns (d, node) with the smallest d, or None when empty."""
+        if not self.count:
+            return None
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            items = buckets[i]
+            buckets[i] = []
+            last = self.last = min(item[0] for item in items)
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+        self.count -= 1
+        return buckets[0].pop()
+
+
+def select_queue(graph):
+    """
+    Scans the edge weights once and returns a queue factory for
+    DijkstraSearch: Dial's buckets when every weight is an int and the max
+    weight is small next to the edge count (see DIAL_EDGES_PER_BUCKET),
+    else None (binary heap). RadixHeap is not picked: in
+    CPython it only matches heapq, whose sift loops run in C, on large
+    integer weights, but it stays available as an explicit choice.
+    Do it once per graph.
+    """
+    max_weight = 0
+    edge_count = 0
+    for edges in graph.values():
+        edge_count += len(edges)
+        for _, weight in edges:
+            if type(weight) is not int or weight < 0:
+                return None
+            if weight > max_weight:
+                max_weight = weight
+    if max_weight <= DIAL_MAX_WEIGHT and max_weight * DIAL_EDGES_PER_BUCKET <= edge_count:
+        return partial(DialQueue, max_weight)
+    return None
+
+
+class DijkstraSearch:
+    """
+    Resumable single-source Dijkstra from start.
+
+    run(targets) settles nodes only until every target is settled and then
+    stops, keeping the heap; a later run() with other targets carries on
+    from there instead of starting over. distances / previous hold the
+    settled nodes only (plus inf / None for targets proven unreachable), so
+    get_path() works for any settled node. Once the heap runs dry,
+    exhausted is True and every node not in distances is unreachable.
+
+    queue is a factory for a bucket queue (see select_queue()); None keeps
+    the binary heap, which works for any non-negative weights.
+    """
+    def __init__(self, graph, start, queue=None):
+        self.graph = graph
+        self.start = start
+        self.distances = {}          # settled node -> final distance
+        self.previous = {}           # settled node -> predecessor
+        self._best = {start: 0}      # frontier node -> tentative distance
+        self._parent = {start: None}
+        if queue is None:
+            # (distance, tie counter, node): the counter keeps labels from being compared
+            self._heap = [(0, 0, start)]
+            self._counter = 1
+            self._queue = None
+        else:
+            self._queue = queue()
+            self._queue.push(0, start)
+        self.exhausted = False
+
+    def settled(self, node):
+        return node in self.distances
+
+    def run(self, targets=None):
+        """Settles nodes until all targets are (every reachable node if None); returns self."""
+        pending = None
+        if targets is not None:
+            pending = {t for t in targets if t not in self.distances}
+            if not pending:
+                return self
+
+        if self._queue is None:
+            done = self._run_heap(pending)
+        else:
+            done = self._run_queue(pending)
+        if done:
+            return self
+
+        self.exhausted = True
+        for t in pending or ():
+            self.distances[t] = INF
+            self.previous[t] = None
+        return self
+
+    def _run_heap(self, pending):
+        # the binary heap stays inlined: heapq calls are cheaper than methods
+        distances, previous = self.distances, self.previous
+        graph, heap = self.graph, self._heap
+        best, parent = self._best, self._parent
+        counter = self._counter
+        while heap:
+            dist, _, node = heappop(heap)
+            if node in distances:
+                continue    # stale entry, node already settled closer
+            distances[node] = dist
+            previous[node] = parent.pop(node)
+            del best[node]
+            for neighbor, weight in graph.get(node, ()):
+                if neighbor in distances:
+                    continue
+                new_dist = dist + weight
+                if new_dist < best.get(neighbor, INF):
+                    best[neighbor] = new_dist
+                    parent[neighbor] = node
+                    heappush(heap, (new_dist, counter, neighbor))
+                    counter += 1
+            if pending is not None:
+                pending.discard(node)
+                if not pending:
+                    self._counter = counter
+                    return True
+        self._counter = counter
+        return False
+
+    def _run_queue(self, pending):
+        distances, previous = self.distances, self.previous
+        graph = self.graph
+        best, parent = self._best, self._parent
+        push, pop = self._queue.push, self._queue.pop
+        while True:
+            entry = pop()
+            if entry is None:
+                return False
+            dist, node = entry
+            if node in distances:
+                continue    # stale entry, node already settled closer
+            distances[node] = dist
+            previous[node] = parent.pop(node)
+            del best[node]
+            for neighbor, weight in graph.get(node, ()):
+                if neighbor in distances:
+                    continue
+                new_dist = dist + weight
+                if new_dist < best.get(neighbor, INF):
+                    best[neighbor] = new_dist
+                    parent[neighbor] = node
+                    push(new_dist, neighbor)
+            if pending is not None:
+                pending.discard(node)
+                if not pending:
+                    return True
+
+
+def dijkstra_search(graph, start, queue='auto'):
+    """
+    Single-source shortest paths from start.
+    Returns (distances, previous) with an entry for every node of graph
+    (and any node that only appears as a neighbor): distances are inf and
+    previous is None for nodes that cannot be reached.
+    queue='auto' runs select_queue(graph) first; a full search reads every
+    edge anyway, so the scan costs little.
+    """
+    if queue == 'auto':
+        queue = select_queue(graph)
+    search = DijkstraSearch(graph, start, queue).run()
+    distances = dict.fromkeys(graph, INF)
+    distances.update(search.distances)
+    previous = dict.fromkeys(graph)
+    previous.update(search.previous)
+    return distances, previous
+
+
+def reverse_adjacency(graph):
+    """{node: [(predecessor, weight), ...]}: the graph with every edge turned around."""
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    return reverse
@@ -0,0 +1,154 @@
+from heapq import heappush, heappop
+import math
+
+from aastar import Grid
+
+
+class DStarLite:
+    """
+    D* Lite incremental planner on a Grid with unit move costs.
+
+    The search runs backwards from the goal and keeps its g/rhs values
+    between calls to plan(). When walls change (add_wall/remove_wall, or
+    cell_changed() after editing the grid directly) only the affected
+    cells are queued again, so a replan touches roughly the region whose
+    distances actually changed instead of the whole map.
+    """
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.last_start = start
+        self.km = 0
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.open_heap = []
+        self.queued = {}    # node -> key currently valid in open_heap
+        self.counter = 0
+        self.expansions = 0  # nodes expanded by the most recent plan()
+        self._push(goal, self._key(goal))
+
+    def _free(self, p):
+        return self.grid.in_bounds(p) and self.grid.passable(p)
+
+    def _cells_around(self, p):
+        x, y = p
+        for dx, dy in [(1,0),(-1,0),(0,1),(0,-1)]:
+            q = (x + dx, y + dy)
+            if self.grid.in_bounds(q):
+                yield q
+
+    def _cost(self, a, b):
+        return 1 if self._free(a) and self._free(b) else math.inf
+
+    def _key(self, s):
+        m = min(self.g.get(s, math.inf), self.rhs.get(s, math.inf))
+        return (m + Grid.manhattan(self.start, s) + self.km, m)
+
+    def _push(self, s, key):
+        self.queued[s] = key
+        heappush(self.open_heap, (key, self.counter, s))
+        self.counter += 1
+
+    def _top_key(self):
+        # drop entries that were superseded or removed
+        while self.open_heap:
+            key, _, s = self.open_heap[0]
+            if self.queued.get(s) == key:
+                return key
+            heappop(self.open_heap)
+        return (math.inf, math.inf)
+
+    def _update_vertex(self, u):
+        if u != self.goal:
+            best = math.inf
+            if self._free(u):
+                g = self.g
+                for s in self._cells_around(u):
+                    c = self._cost(u, s) + g.get(s, math.inf)
+                    if c < best:
+                        best = c
+            self.rhs[u] = best
+        if self.g.get(u, math.inf) != self.rhs.get(u, math.inf):
+            self._push(u, self._key(u))
+        else:
+            self.queued.pop(u, None)
+
+    def _compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        while (self._top_key() < self._key(self.start)
+               or rhs.get(self.start, math.inf) != g.get(self.start, math.inf)):
+            k_old, _, u = heappop(self.open_heap)
+            if self.queued.get(u) != k_old:
+                continue
+            self.expansions += 1
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u, k_new)
+            elif g.get(u, math.inf) > rhs.get(u, math.inf):
+                g[u] = rhs[u]
+                del self.queued[u]
+                for s in self._cells_around(u):
+                    self._update_vertex(s)
+            else:
+                g[u] = math.inf
+                del self.queued[u]
+                self._update_vertex(u)
+                for s in self._cells_around(u):
+                    self._update_vertex(s)
+
+    def plan(self):
+        """
+        Brings the search up to date and returns (path, cost) from the
+        current start to the goal, or (None, inf) if no path.
+        """
+        self.expansions = 0
+        self._compute_shortest_path()
+        cost = self.g.get(self.start, math.inf)
+        if cost == math.inf:
+            return None, math.inf
+
+        path = [self.start]
+        s = self.start
+        while s != self.goal:
+            s = min(self._cells_around(s),
+                    key=lambda q: self._cost(s, q) + self.g.get(q, math.inf))
+            path.append(s)
+        return path, cost
+
+    def move_start(self, start):
+        """Tell the planner the agent now stands on start."""
+        self.km += Grid.manhattan(self.last_start, start)
+        self.last_start = start
+        self.start = start
+
+    def cell_changed(self, p):
+        """Notification that cell p became a wall or open after the last plan()."""
+        self._update_vertex(p)
+        for s in self._cells_around(p):
+            self._update_vertex(s)
+
+    def add_wall(self, p):
+        self.grid.add_wall(p)
+        self.cell_changed(p)
+
+    def remove_wall(self, p):
+        self.grid.remove_wall(p)
+        self.cell_changed(p)
+
+
+if __name__ == '__main__':
+    grid = Grid(40, 40)
+    planner = DStarLite(grid, (0, 0), (39, 39))
+    path, cost = planner.plan()
+    print(f'initial plan: cost {cost}, {planner.expansions} expansions')
+
+    # close a "door" in the middle of the current path and replan
+    door = path[len(path) // 2]
+    planner.add_wall(door)
+    path, cost = planner.plan()
+    print(f'after closing {door}: cost {cost}, {planner.expansions} expansions')
+
+    planner.remove_wall(door)
+    path, cost = planner.plan()
+    print(f'after opening {door}: cost {cost}, {planner.expansions} expansions')
@@ -0,0 +1,243 @@
+from collections import deque
+import math
+
+from aastar import BitmapGrid
+
+
+# direction codes stored in FlowField.field
+STAY, RIGHT, LEFT, DOWN, UP, NONE = range(6)
+DIRECTIONS = {RIGHT: (1, 0), LEFT: (-1, 0), DOWN: (0, 1), UP: (0, -1), STAY: (0, 0)}
+
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    One reverse search from a goal that serves every agent heading there.
+
+    dist[i] is the number of steps from cell i (= y*w + x) to the goal, or
+    UNREACHABLE; field[i] is the direction code of the next step. An agent
+    follows the field with next_step(p) in O(1) per move. The distance
+    transform is a BFS wavefront over the grid's bytearray, and add_wall /
+    remove_wall repair only the cells whose distance actually changes.
+
+    A plain Grid is copied into a BitmapGrid (self.bitmap) for the
+    wavefront; a BitmapGrid is used as is. Either way add_wall/remove_wall
+    also edit the caller's grid. Edits made to the grid behind the field's
+    back are only picked up by rebuild().
+    """
+    def __init__(self, grid, goal):
+        self.grid = grid
+        self.bitmap = grid if isinstance(grid, BitmapGrid) else None    # filled by rebuild()
+        self.goal = goal
+        n = grid.w * grid.h
+        self.dist = [UNREACHABLE] * n
+        self.field = bytearray([NONE]) * n
+        self.rebuild()
+
+    def _index(self, p):
+        return p[1] * self.bitmap.w + p[0]
+
+    def _around(self, i):
+        """(neighbor index, direction from i to it) for in-bounds neighbors."""
+        w, h = self.bitmap.w, self.bitmap.h
+        y, x = divmod(i, w)
+        if x + 1 < w:
+            yield i + 1, RIGHT
+        if x > 0:
+            yield i - 1, LEFT
+        if y + 1 < h:
+            yield i + w, DOWN
+        if y > 0:
+            yield i - w, UP
+
+    def _wavefront(self, seeds):
+        """BFS outward from seeds (already holding their final distance)."""
+        cells, dist = self.bitmap.cells, self.dist
+        queue = deque(seeds)
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for j, _ in self._around(i):
+                if not cells[j] and (dist[j] == UNREACHABLE or dist[j] > d):
+                    dist[j] = d
+                    queue.append(j)
+
+    def _point(self, i):
+        # next step is any neighbor one step closer to the goal
+        dist = self.dist
+        d = dist[i]
+        if d == UNREACHABLE:
+            self.field[i] = NONE
+        elif d == 0:
+            self.field[i] = STAY
+        else:
+            for j, direction in self._around(i):
+                if dist[j] == d - 1:
+                    self.field[i] = direction
+                    break
+
+    def rebuild(self):
+        """Full distance transform from the goal, re-reading a plain Grid's walls."""
+        if self.bitmap is not self.grid:
+            self.bitmap = BitmapGrid(self.grid.w, self.grid.h, self.grid.walls)
+        n = len(self.dist)
+        self.dist[:] = [UNREACHABLE] * n
+        g = self._index(self.goal)
+        if self.bitmap.passable(self.goal):
+            self.dist[g] = 0
+            self._wavefront([g])
+        for i in range(n):
+            self._point(i)
+
+    def distance(self, p):
+        d = self.dist[self._index(p)]
+        return math.inf if d == UNREACHABLE else d
+
+    def next_step(self, p):
+        """Next cell on a shortest path to the goal, p itself at the goal, None if stuck."""
+        code = self.field[self._index(p)]
+        if code == NONE:
+            return None
+        dx, dy = DIRECTIONS[code]
+        return (p[0] + dx, p[1] + dy)
+
+    def path(self, p):
+        if self.next_step(p) is None:
+            return None
+        path = [p]
+        while p != self.goal:
+            p = self.next_step(p)
+            path.append(p)
+        return path
+
+    # ---------- incremental updates ----------
+
+    def add_wall(self, p):
+        """
+        Block p and repair the field. Cells whose every shortest route ran
+        through p lose their distance, then are refilled from the boundary
+        of the still-valid region.
+        """
+        self.bitmap.add_wall(p)
+        if self.grid is not self.bitmap:
+            self.grid.add_wall(p)
+        i = self._index(p)
+        dist, cells = self.dist, self.bitmap.cells
+        if dist[i] == UNREACHABLE:
+            return
+        changed = {i}
+        dist[i] = UNREACHABLE
+        queue = deque([i])
+        # collect cells that no longer have a neighbor one step closer
+        while queue:
+            k = queue.popleft()
+            for j, _ in self._around(k):
+                if j in changed or dist[j] == UNREACHABLE or dist[j] == 0:
+                    continue
+                if not any(dist[m] == dist[j] - 1 and m not in changed
+                           for m, _ in self._around(j)):
+                    changed.add(j)
+                    queue.append(j)
+        for j in changed:
+            dist[j] = UNREACHABLE
+        # refill from intact neighbors of the invalidated region
+        seeds = []
+        for j in changed:
+            if cells[j]:
+                continue
+            best = UNREACHABLE
+            for m, _ in self._around(j):
+                if dist[m] != UNREACHABLE and (best == UNREACHABLE or dist[m] + 1 < best):
+                    best = dist[m] + 1
+            if best != UNREACHABLE:
+                dist[j] = best
+                seeds.append(j)
+        seeds.sort(key=dist.__getitem__)
+        self._wavefront_ordered(seeds)
+        self._repoint(changed)
+
+    def remove_wall(self, p):
+        """Open p and push the improvement outwards as far as it reaches."""
+        self.bitmap.remove_wall(p)
+        if self.grid is not self.bitmap:
+            self.grid.remove_wall(p)
+        i = self._index(p)
+        dist = self.dist
+        if i == self._index(self.goal):
+            dist[i] = 0
+        else:
+            best = UNREACHABLE
+            for m, _ in self._around(i):
+                if dist[m] != UNREACHABLE and (best == UNREACHABLE or dist[m] + 1 < best):
+                    best = dist[m] + 1
+            dist[i] = best
+        if dist[i] == UNREACHABLE:
+            return
+        touched = self._wavefront_ordered([i])
+        self._repoint(touched)
+
+    def _wavefront_ordered(self, seeds):
+        """
+        Like _wavefront, but seeds may hold different distances; a bucketed
+        queue keeps expansion in distance order. Returns the touched cells.
+        """
+        cells, dist = self.bitmap.cells, self.dist
+        buckets = {}
+        for s in seeds:
+            buckets.setdefault(dist[s], []).append(s)
+        touched = set(seeds)
+        if not buckets:
+            return touched
+        d = min(buckets)
+        while buckets:
+            bucket = buckets.pop(d, None)
+            if bucket:
+                for i in bucket:
+                    if dist[i] != d:
+                        continue
+                    for j, _ in self._around(i):
+                        if not cells[j] and (dist[j] == UNREACHABLE or dist[j] > d + 1):
+                            dist[j] = d + 1
+                            buckets.setdefault(d + 1, []).append(j)
+                            touched.add(j)
+            d += 1
+        return touched
+
+    def _repoint(self, cells):
+        # a changed distance can alter the direction of the cell and its neighbors
+        todo = set(cells)
+        for i in cells:
+            todo.update(j for j, _ in self._around(i))
+        for i in todo:
+            self._point(i)
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    from aastar import astar, open_cells, random_grid, unit_cost
+
+    size = 200
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng, BitmapGrid)
+    goal = (size // 2, size // 2)
+    grid.remove_wall(goal)
+    free = open_cells(grid)
+    agents = [rng.choice(free) for _ in range(200)]
+
+    t0 = time.perf_counter()
+    for a in agents:
+        astar(a, lambda s: s == goal, grid.neighbors, unit_cost, lambda s: grid.manhattan(s, goal))
+    t1 = time.perf_counter()
+    flow = FlowField(grid, goal)
+    for a in agents:
+        flow.path(a)
+    t2 = time.perf_counter()
+    door = free[len(free) // 3]
+    flow.add_wall(door)
+    t3 = time.perf_counter()
+
+    print(f'{len(agents)} agents, separate astar(): {t1 - t0:.3f}s')
+    print(f'{len(agents)} agents, one flow field:   {t2 - t1:.3f}s')
+    print(f'incremental update after closing {door}: {t3 - t2:.4f}s')
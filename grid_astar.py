@@ -0,0 +1,111 @@
+from heapq import heappush, heappop
+import math
+
+from aastar import BitmapGrid
+
+
+class GridAStar:
+    """
+    A* specialised for a static 4-connected grid with unit costs.
+
+    Nodes are integer ids (y*w + x). The g/parent/closed arrays are
+    allocated once and reused by every query; a generation counter marks
+    which entries belong to the current query, so nothing is cleared
+    between searches.
+    """
+    def __init__(self, grid):
+        if not isinstance(grid, BitmapGrid):
+            grid = BitmapGrid(grid.w, grid.h, grid.walls)
+        self.grid = grid
+        n = grid.w * grid.h
+        self.g = [0] * n
+        self.parent = [-1] * n
+        self.seen = [0] * n     # generation in which g/parent were written
+        self.closed = [0] * n   # generation in which the node was closed
+        self.generation = 0
+        self.open_heap = []
+
+    def search(self, start, goal):
+        """Returns (path, cost) like astar(), or (None, inf) if no path."""
+        if start == goal:
+            return [start], 0
+
+        grid = self.grid
+        w, h = grid.w, grid.h
+        cells = grid.cells
+        g_score, parent, seen, closed = self.g, self.parent, self.seen, self.closed
+        self.generation += 1
+        gen = self.generation
+        open_heap = self.open_heap
+        open_heap.clear()
+
+        gx, gy = goal
+        s = start[1] * w + start[0]
+        t = gy * w + gx
+        g_score[s] = 0
+        parent[s] = -1
+        seen[s] = gen
+        counter = 0
+        heappush(open_heap, (abs(start[0] - gx) + abs(start[1] - gy), 0, counter, s))
+        counter += 1
+
+        while open_heap:
+            f, g, _, current = heappop(open_heap)
+            if closed[current] == gen:
+                continue
+            if current == t:
+                return self._path(current, w), g
+            closed[current] = gen
+
+            y, x = divmod(current, w)
+            ng = g + 1
+            # same neighbor order as Grid.neighbors: +x, -x, +y, -y
+            for nb, ok in ((current + 1, x + 1 < w), (current - 1, x > 0),
+                           (current + w, y + 1 < h), (current - w, y > 0)):
+                if not ok or cells[nb]:
+                    continue
+                if seen[nb] == gen and ng >= g_score[nb]:
+                    continue
+                g_score[nb] = ng
+                parent[nb] = current
+                seen[nb] = gen
+                ny, nx = divmod(nb, w)
+                heappush(open_heap, (ng + abs(nx - gx) + abs(ny - gy), ng, counter, nb))
+                counter += 1
+
+        return None, math.inf
+
+    def _path(self, node, w):
+        parent = self.parent
+        path = []
+        while node != -1:
+            y, x = divmod(node, w)
+            path.append((x, y))
+            node = parent[node]
+        path.reverse()
+        return path
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    from aastar import astar, open_cells, random_grid, unit_cost
+
+    size = 200
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng, BitmapGrid)
+    free = open_cells(grid)
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(50)]
+
+    t0 = time.perf_counter()
+    for start, goal in queries:
+        astar(start, lambda s: s == goal, grid.neighbors, unit_cost,
+              lambda s: grid.manhattan(s, goal))
+    t1 = time.perf_counter()
+    engine = GridAStar(grid)
+    for start, goal in queries:
+        engine.search(start, goal)
+    t2 = time.perf_counter()
+
+    print(f'astar():          {t1 - t0:.3f}s for {len(queries)} queries')
+    print(f'GridAStar.search: {t2 - t1:.3f}s for {len(queries)} queries')
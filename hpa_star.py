@@ -0,0 +1,256 @@
+from collections import deque
+import math
+
+from aastar import Grid, astar, unit_cost
+
+
+class HPAStar:
+    """
+    Hierarchical path-finding (HPA*) over a Grid with unit move costs.
+
+    The grid is cut into cluster_size x cluster_size clusters. Every open
+    stretch along a border between two clusters becomes an entrance with one
+    or two transition cells on each side. Distances between the transition
+    cells of a cluster are cached, so a query only searches the small
+    abstract graph and then refines each abstract edge inside one cluster.
+    Paths are near-optimal; quality_report() measures the loss.
+    """
+    # entrances at least this long get a transition at both ends
+    WIDE_ENTRANCE = 6
+
+    def __init__(self, grid, cluster_size=10):
+        self.grid = grid
+        self.k = cluster_size
+        self.cols = math.ceil(grid.w / cluster_size)
+        self.rows = math.ceil(grid.h / cluster_size)
+        self.borders = {}   # (cluster, cluster) -> [(a, b), ...] transition pairs
+        self.inter = {}     # node -> set of nodes across a border
+        self.intra = {}     # cluster -> {node: {node: distance}}
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                for other in ((cx + 1, cy), (cx, cy + 1)):
+                    if self._exists(other):
+                        self._build_border((cx, cy), other)
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                self._build_intra((cx, cy))
+
+    # ---------- clusters ----------
+
+    def _exists(self, c):
+        return 0 <= c[0] < self.cols and 0 <= c[1] < self.rows
+
+    def cluster_of(self, p):
+        return (p[0] // self.k, p[1] // self.k)
+
+    def _bounds(self, c):
+        x0, y0 = c[0] * self.k, c[1] * self.k
+        return x0, y0, min(x0 + self.k, self.grid.w), min(y0 + self.k, self.grid.h)
+
+    def _adjacent_clusters(self, c):
+        cx, cy = c
+        for other in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if self._exists(other):
+                yield other
+
+    def _free(self, p):
+        return self.grid.in_bounds(p) and self.grid.passable(p)
+
+    def _local_neighbors(self, c):
+        x0, y0, x1, y1 = self._bounds(c)
+        def neighbors(p):
+            for q in self.grid.neighbors(p):
+                if x0 <= q[0] < x1 and y0 <= q[1] < y1:
+                    yield q
+        return neighbors
+
+    def _local_distances(self, src, c):
+        """BFS distances from src to every cell reachable inside cluster c."""
+        neighbors = self._local_neighbors(c)
+        dist = {src: 0}
+        queue = deque([src])
+        while queue:
+            p = queue.popleft()
+            for q in neighbors(p):
+                if q not in dist:
+                    dist[q] = dist[p] + 1
+                    queue.append(q)
+        return dist
+
+    # ---------- abstract graph construction ----------
+
+    def _border_cells(self, a, b):
+        """Pairs of facing cells along the border between clusters a and b."""
+        if a > b:
+            a, b = b, a
+        x0, y0, x1, y1 = self._bounds(a)
+        if b[0] != a[0]:
+            return [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        return [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+
+    def _build_border(self, a, b):
+        key = (min(a, b), max(a, b))
+        for p, q in self.borders.get(key, ()):
+            self.inter[p].discard(q)
+            self.inter[q].discard(p)
+            if not self.inter[p]:
+                del self.inter[p]
+            if not self.inter[q]:
+                del self.inter[q]
+
+        pairs = []
+        run = []
+        for p, q in self._border_cells(a, b) + [(None, None)]:
+            if p is not None and self._free(p) and self._free(q):
+                run.append((p, q))
+                continue
+            if run:
+                if len(run) >= self.WIDE_ENTRANCE:
+                    pairs.extend((run[0], run[-1]))
+                else:
+                    pairs.append(run[len(run) // 2])
+                run = []
+        self.borders[key] = pairs
+        for p, q in pairs:
+            self.inter.setdefault(p, set()).add(q)
+            self.inter.setdefault(q, set()).add(p)
+
+    def _cluster_nodes(self, c):
+        nodes = set()
+        for other in self._adjacent_clusters(c):
+            for p, q in self.borders[(min(c, other), max(c, other))]:
+                nodes.add(p if self.cluster_of(p) == c else q)
+        return nodes
+
+    def _build_intra(self, c):
+        nodes = self._cluster_nodes(c)
+        table = {}
+        for n in nodes:
+            dist = self._local_distances(n, c)
+            table[n] = {m: dist[m] for m in nodes if m != n and m in dist}
+        self.intra[c] = table
+
+    def rebuild_cluster(self, c):
+        """Recompute the entrances around cluster c and the affected caches."""
+        for other in self._adjacent_clusters(c):
+            self._build_border(c, other)
+        self._build_intra(c)
+        for other in self._adjacent_clusters(c):
+            self._build_intra(other)
+
+    def wall_changed(self, p):
+        self.rebuild_cluster(self.cluster_of(p))
+
+    def add_wall(self, p):
+        self.grid.add_wall(p)
+        self.wall_changed(p)
+
+    def remove_wall(self, p):
+        self.grid.remove_wall(p)
+        self.wall_changed(p)
+
+    # ---------- queries ----------
+
+    def find_path(self, start, goal):
+        """Returns (path, cost) like astar(), or (None, inf) if no path."""
+        if start == goal:
+            return [start], 0
+        if not (self._free(start) and self._free(goal)):
+            return None, math.inf
+
+        sc, gc = self.cluster_of(start), self.cluster_of(goal)
+        start_dist = self._local_distances(start, sc)
+        goal_dist = self._local_distances(goal, gc)
+        start_links = {n: start_dist[n] for n in self.intra[sc] if n in start_dist}
+        if goal in start_dist:
+            start_links[goal] = start_dist[goal]
+        goal_links = {n: goal_dist[n] for n in self.intra[gc] if n in goal_dist}
+
+        memo = {}    # node -> outgoing abstract edges, built once per query
+
+        def edges(n):
+            e = memo.get(n)
+            if e is not None:
+                return e
+            e = memo[n] = {}
+            if n == start:
+                e.update(start_links)
+            if n in self.inter:
+                e.update(self.intra[self.cluster_of(n)][n])
+                for m in self.inter[n]:
+                    e[m] = 1
+            if n in goal_links:
+                e[goal] = min(e.get(goal, math.inf), goal_links[n])
+            return e
+
+        abstract, cost = astar(start,
+                               lambda s: s == goal,
+                               lambda s: edges(s).keys(),
+                               lambda a, b: edges(a)[b],
+                               lambda s: Grid.manhattan(s, goal))
+        if abstract is None:
+            return None, math.inf
+        return self._refine(abstract), cost
+
+    def _refine(self, abstract):
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            c = self.cluster_of(a)
+            if c != self.cluster_of(b):
+                path.append(b)   # border crossing
+                continue
+            segment, _ = astar(a,
+                               lambda s: s == b,
+                               self._local_neighbors(c),
+                               unit_cost,
+                               lambda s: Grid.manhattan(s, b))
+            path.extend(segment[1:])
+        return path
+
+
+def quality_report(hpa, queries):
+    """
+    Compares HPA* against astar() on (start, goal) pairs.
+    Returns a dict with the number of solved queries, how many came back
+    suboptimal, and the mean / worst cost ratio (HPA* cost / optimal cost).
+    """
+    grid = hpa.grid
+    ratios = []
+    for start, goal in queries:
+        _, optimal = astar(start,
+                           lambda s: s == goal,
+                           lambda s: grid.neighbors(s),
+                           unit_cost,
+                           lambda s: grid.manhattan(s, goal))
+        _, cost = hpa.find_path(start, goal)
+        if optimal == math.inf or optimal == 0:
+            continue
+        ratios.append(cost / optimal)
+    return {
+        'queries': len(ratios),
+        'suboptimal': sum(1 for r in ratios if r > 1),
+        'mean_ratio': sum(ratios) / len(ratios) if ratios else 1.0,
+        'max_ratio': max(ratios, default=1.0),
+    }
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    from aastar import open_cells, random_grid
+
+    size = 200
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng)
+    free = open_cells(grid)
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(30)]
+
+    t0 = time.perf_counter()
+    hpa = HPAStar(grid, cluster_size=16)
+    t1 = time.perf_counter()
+    for start, goal in queries:
+        hpa.find_path(start, goal)
+    t2 = time.perf_counter()
+
+    print(f'preprocessing: {t1 - t0:.3f}s, queries: {t2 - t1:.3f}s for {len(queries)}')
+    print('path quality vs astar():', quality_report(hpa, queries))
@@ -0,0 +1,279 @@
+from heapq import heappush, heappop
+import math
+
+from aastar import BitmapGrid
+
+
+# Jump Point Search for the 4-connected, uniform-cost grids used by aastar.Grid.
+#
+# Canonical ordering: among equal-length paths we keep the one that turns
+# vertical as early as possible. A horizontal move may therefore only turn
+# vertical when the cell diagonally behind it is blocked (a "forced" neighbor),
+# while a vertical move may always branch left/right. A vertical jump stops
+# on any cell from which a horizontal jump would find something, the same way
+# diagonal jumps do in 8-connected JPS.
+#
+# Every row is kept as an int bitmask (bit x set = open), and the cells with
+# forced neighbors are precomputed per row and direction (JPS+ style). A
+# horizontal jump is then a couple of big-int operations that find the first
+# stop bit, and a vertical jump tests one precomputed bit per row instead of
+# scanning the row.
+
+
+class JumpPointSearch:
+    """
+    Precomputed jump tables for one grid; search() answers queries.
+    The tables are a snapshot: build a new one after the walls change.
+    """
+    def __init__(self, grid):
+        w, h = grid.w, grid.h
+        self.w, self.h = w, h
+        if isinstance(grid, BitmapGrid):
+            cells = grid.cells
+        else:
+            cells = bytearray(w * h)
+            for x, y in grid.walls:
+                if 0 <= x < w and 0 <= y < h:
+                    cells[y * w + x] = 1
+
+        # bit x of rows[y] is set when (x, y) is open
+        to_digits = bytes.maketrans(b'\x00\x01', b'10')
+        rows = [int(bytes(cells[y * w:(y + 1) * w]).translate(to_digits)[::-1], 2) if w else 0
+                for y in range(h)]
+        full = (1 << w) - 1
+        left_edge = 1 << (w - 1) if w else 0
+
+        forced_r, forced_l, sees = [], [], []
+        for y in range(h):
+            o = rows[y]
+            up = rows[y - 1] if y > 0 else 0
+            dn = rows[y + 1] if y + 1 < h else 0
+            # arriving with dx = +1: blocked at (x-1, y+dy), open at (x, y+dy);
+            # x-1 < 0 counts as blocked, hence the | 1
+            fr = o & ((((full ^ up) << 1 | 1) & up) | (((full ^ dn) << 1 | 1) & dn))
+            fl = o & ((((full ^ up) >> 1 | left_edge) & up) | (((full ^ dn) >> 1 | left_edge) & dn))
+            forced_r.append(fr)
+            forced_l.append(fl)
+
+            # cells whose horizontal jump reaches a forced cell before a wall
+            s = 0
+            while o:
+                low = o & -o
+                run = o & ~(o + low)      # lowest run of open cells
+                o ^= run
+                r = fr & run
+                if r:
+                    s |= run & ((1 << (r.bit_length() - 1)) - 1)
+                l = fl & run
+                if l:
+                    s |= run >> (l & -l).bit_length() << (l & -l).bit_length()
+            sees.append(s)
+
+        self.rows = rows
+        self.forced_r = forced_r
+        self.forced_l = forced_l
+        self.sees = sees
+        self.full = full
+        self.wall_r = (full << 1) | 1    # wall mask including bit w, past the edge
+
+    def _open(self, x, y):
+        return 0 <= x < self.w and 0 <= y < self.h and self.rows[y] >> x & 1 == 1
+
+    def _jump_horizontal(self, x, y, dx, goal):
+        """x of the next jump point from (x, y) along dx, or -1."""
+        o = self.rows[y]
+        if dx > 0:
+            targets = self.forced_r[y]
+            if y == goal[1]:
+                targets |= 1 << goal[0]
+            # bit w (past the edge) is in the wall mask, so a stop always exists
+            stops = (self.wall_r ^ o | targets) >> (x + 1)
+            pos = x + (stops & -stops).bit_length()
+        else:
+            targets = self.forced_l[y]
+            if y == goal[1]:
+                targets |= 1 << goal[0]
+            stops = (self.full ^ o | targets) & ((1 << x) - 1)
+            if not stops:
+                return -1
+            pos = stops.bit_length() - 1
+        return pos if targets >> pos & 1 else -1
+
+    def _jump_vertical(self, x, y, dy, goal):
+        """y of the next jump point from (x, y) along dy, or -1."""
+        rows, sees, h = self.rows, self.sees, self.h
+        gx, gy = goal
+        while True:
+            y += dy
+            if y < 0 or y >= h or not rows[y] >> x & 1:
+                return -1
+            if y == gy:
+                if (x == gx or self._jump_horizontal(x, y, 1, goal) >= 0
+                        or self._jump_horizontal(x, y, -1, goal) >= 0):
+                    return y
+            elif sees[y] >> x & 1:
+                return y
+
+    def search(self, start, goal, stats=None):
+        """
+        Returns (path, cost) like astar(), or (None, inf) if no path.
+        The returned path lists every cell, not just the jump points.
+        Pass a dict as stats to get 'expansions' and 'pushes' back.
+        """
+        expansions = pushes = 0
+        result = None, math.inf
+        if start == goal:
+            result = [start], 0
+        elif self._open(*start) and self._open(*goal):
+            result, expansions, pushes = self._search(start, goal)
+        if stats is not None:
+            stats.update(expansions=expansions, pushes=pushes)
+        return result
+
+    def _search(self, start, goal):
+        w = self.w
+        rows = self.rows
+        jump_h, jump_v = self._jump_horizontal, self._jump_vertical
+        gx, gy = goal
+        # search states are ints: (y*w + x) << 3 | incoming direction,
+        # with direction 4 for the start
+        goal_cell = gy * w + gx
+        start_state = (start[1] * w + start[0]) << 3 | 4
+        g_score = {start_state: 0}
+        parent = {start_state: None}
+        # (f, -g, state): among equal f prefer the deeper state. Manhattan
+        # distance ties on almost every open cell, and this dives towards the
+        # goal instead of widening the whole tie band.
+        open_heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, start_state)]
+        pushes = 1
+        expansions = 0
+
+        while open_heap:
+            f, g, state = heappop(open_heap)
+            g = -g
+            if g > g_score[state]:
+                continue    # stale entry
+            cell = state >> 3
+            if cell == goal_cell:
+                jump_points = []
+                while state is not None:
+                    y, x = divmod(state >> 3, w)
+                    jump_points.append((x, y))
+                    state = parent[state]
+                jump_points.reverse()
+                return (_expand_path(jump_points), g), expansions, pushes
+            expansions += 1
+
+            y, x = divmod(cell, w)
+            d = state & 7
+            if d == 4:
+                dirs = (0, 1, 2, 3)
+            elif d >= 2:
+                dirs = (d, 0, 1)
+            else:
+                # horizontal: go on, plus forced turns where the cell
+                # diagonally behind is blocked
+                dirs = [d]
+                bx = x - 1 if d == 0 else x + 1
+                for ny, nd in ((y + 1, 2), (y - 1, 3)):
+                    if (0 <= ny < self.h and rows[ny] >> x & 1
+                            and not (0 <= bx < w and rows[ny] >> bx & 1)):
+                        dirs.append(nd)
+
+            for nd in dirs:
+                if nd < 2:
+                    jx = jump_h(x, y, 1 if nd == 0 else -1, goal)
+                    if jx < 0:
+                        continue
+                    jy = y
+                    step = abs(jx - x)
+                else:
+                    jy = jump_v(x, y, 1 if nd == 2 else -1, goal)
+                    if jy < 0:
+                        continue
+                    jx = x
+                    step = abs(jy - y)
+                nb = (jy * w + jx) << 3 | nd
+                tentative_g = g + step
+                old = g_score.get(nb)
+                if old is not None and tentative_g >= old:
+                    continue
+                g_score[nb] = tentative_g
+                parent[nb] = state
+                heappush(open_heap, (tentative_g + abs(jx - gx) + abs(jy - gy), -tentative_g, nb))
+                pushes += 1
+
+        return (None, math.inf), expansions, pushes
+
+
+def _expand_path(jump_points):
+    """Fill in the straight runs between consecutive jump points."""
+    path = [jump_points[0]]
+    for (x1, y1) in jump_points[1:]:
+        x0, y0 = path[-1]
+        sx = (x1 > x0) - (x1 < x0)
+        sy = (y1 > y0) - (y1 < y0)
+        while (x0, y0) != (x1, y1):
+            x0 += sx
+            y0 += sy
+            path.append((x0, y0))
+    return path
+
+
+def jps(grid, start, goal, stats=None):
+    """
+    Jump Point Search on a Grid with unit move costs.
+    Returns (path, cost) like astar(), or (None, inf) if no path.
+    The returned path lists every cell, not just the jump points.
+    Builds the jump tables for this one query; to answer many queries on
+    the same walls, keep a JumpPointSearch(grid) and call its search().
+    """
+    return JumpPointSearch(grid).search(start, goal, stats)
+
+
+if __name__ == '__main__':
+    import random
+    import sys
+    import time
+    from aastar import astar, unit_cost
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    queries = 5
+    for density in (0.01, 0.10, 0.20):
+        rng = random.Random(1)
+        grid = BitmapGrid(size, size)
+        for _ in range(int(size * size * density)):
+            grid.cells[rng.randrange(size * size)] = 1
+        free = [i for i, c in enumerate(grid.cells) if not c]
+        pairs = []
+        for _ in range(queries):
+            a, b = rng.choice(free), rng.choice(free)
+            pairs.append(((a % size, a // size), (b % size, b // size)))
+
+        t0 = time.perf_counter()
+        engine = JumpPointSearch(grid)
+        t_build = time.perf_counter() - t0
+
+        totals = {'astar': [0, 0.0], 'jps': [0, 0.0]}
+        for start, goal in pairs:
+            t0 = time.perf_counter()
+            _, cost_a = astar(start, lambda s: s == goal, grid.neighbors, unit_cost,
+                              lambda s: grid.manhattan(s, goal))
+            totals['astar'][1] += time.perf_counter() - t0
+            stats = {}
+            astar(start, lambda s: s == goal, grid.neighbors, unit_cost,
+                  lambda s: grid.manhattan(s, goal), stats=stats)
+            totals['astar'][0] += stats['pushes']
+
+            stats = {}
+            t0 = time.perf_counter()
+            _, cost_j = engine.search(start, goal, stats)
+            totals['jps'][1] += time.perf_counter() - t0
+            totals['jps'][0] += stats['pushes']
+            if cost_a != cost_j:
+                raise AssertionError(f'{start} -> {goal}: astar {cost_a}, jps {cost_j}')
+
+        print(f'{size}x{size}, {density:.0%} walls, {queries} queries '
+              f'(jump tables built in {t_build:.3f}s)')
+        for name, (pushes, elapsed) in totals.items():
+            print(f'  {name:<6} heap pushes {pushes:>9}   time {elapsed:7.3f}s')
@@ -0,0 +1,194 @@
+from array import array
+from heapq import heappush, heappop
+import math
+
+
+# ALT (A*, Landmarks, Triangle inequality) heuristics for general graphs.
+#
+# Graphs are given the same way astar() sees them: a node list, a
+# neighbors_fn and a g_cost_fn. For every landmark L we store d(L, v) and
+# d(v, L); then for any target t
+#     d(v, t) >= d(L, t) - d(L, v)   and   d(v, t) >= d(v, L) - d(t, L)
+# which gives an admissible (and consistent) heuristic for astar().
+
+def dijkstra_all(source, neighbors_fn, g_cost_fn):
+    """Heap-based Dijkstra: returns {node: distance} for everything reachable."""
+    dist = {source: 0}
+    heap = [(0, 0, source)]
+    counter = 1
+    done = set()
+    while heap:
+        d, _, u = heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        for v in neighbors_fn(u):
+            nd = d + g_cost_fn(u, v)
+            if v not in dist or nd < dist[v]:
+                dist[v] = nd
+                heappush(heap, (nd, counter, v))
+                counter += 1
+    return dist
+
+
+def reverse_graph(nodes, neighbors_fn, g_cost_fn):
+    """Builds predecessor lists so distances *to* a landmark can be computed."""
+    preds = {n: [] for n in nodes}
+    for u in nodes:
+        for v in neighbors_fn(u):
+            preds.setdefault(v, []).append((u, g_cost_fn(u, v)))
+    return preds
+
+
+class Landmarks:
+    """
+    Landmark distance tables stored as flat double arrays, one row per
+    landmark, columns in node order. Use heuristic(goal) to get a callable
+    for astar().
+    """
+    def __init__(self, nodes, landmarks, forward, backward):
+        self.nodes = list(nodes)
+        self.index = {n: i for i, n in enumerate(self.nodes)}
+        self.landmarks = list(landmarks)
+        self.forward = forward    # forward[k*n + i]  = d(L_k, node_i)
+        self.backward = backward  # backward[k*n + i] = d(node_i, L_k)
+
+    @classmethod
+    def build(cls, nodes, neighbors_fn, g_cost_fn, count=8, directed=True, seed_node=None):
+        """
+        Picks count landmarks with farthest-point selection and precomputes
+        the distance tables. Set directed=False when neighbors_fn is
+        symmetric to skip the reverse searches.
+        """
+        nodes = list(nodes)
+        preds = reverse_graph(nodes, neighbors_fn, g_cost_fn) if directed else None
+        reverse_neighbors = (lambda u: (v for v, _ in preds[u])) if directed else neighbors_fn
+        reverse_cost = ((lambda u, v: min(c for w, c in preds[u] if w == v))
+                        if directed else g_cost_fn)
+
+        chosen = []
+        forward = array('d')
+        backward = array('d')
+        # distance from the current landmark set, used to pick the next one
+        nearest = {v: math.inf for v in nodes}
+        current = seed_node if seed_node is not None else (nodes[0] if nodes else None)
+        while current is not None and len(chosen) < count:
+            chosen.append(current)
+            d_from = dijkstra_all(current, neighbors_fn, g_cost_fn)
+            d_to = (dijkstra_all(current, reverse_neighbors, reverse_cost)
+                    if directed else d_from)
+            forward.extend(d_from.get(v, math.inf) for v in nodes)
+            backward.extend(d_to.get(v, math.inf) for v in nodes)
+
+            # farthest reachable node from all landmarks so far
+            current = None
+            far = -1
+            for v in nodes:
+                d = min(nearest[v], d_from.get(v, math.inf))
+                nearest[v] = d
+                if d != math.inf and d > far and v not in chosen:
+                    far = d
+                    current = v
+            if far <= 0:
+                current = None
+        return cls(nodes, chosen, forward, backward)
+
+    def heuristic(self, goal):
+        """Returns h(s), an admissible estimate of d(s, goal), for astar()."""
+        n = len(self.nodes)
+        t = self.index[goal]
+        fwd, bwd = self.forward, self.backward
+        rows = []
+        for k in range(len(self.landmarks)):
+            base = k * n
+            rows.append((base, fwd[base + t], bwd[base + t]))
+        index = self.index
+
+        def h(s):
+            i = index.get(s)
+            if i is None:
+                return 0
+            best = 0
+            for base, lt, tl in rows:
+                ls = fwd[base + i]
+                sl = bwd[base + i]
+                if ls != math.inf:
+                    if lt == math.inf:
+                        return math.inf   # L reaches s but not goal: s cannot reach goal
+                    if lt - ls > best:
+                        best = lt - ls
+                if tl != math.inf:
+                    if sl == math.inf:
+                        return math.inf   # goal reaches L but s does not: s cannot reach goal
+                    if sl - tl > best:
+                        best = sl - tl
+            return best
+        return h
+
+    def save(self, path):
+        """Writes the tables as raw doubles; node labels go in a sidecar .nodes file."""
+        with open(path, 'wb') as f:
+            header = array('q', [len(self.nodes), len(self.landmarks)])
+            header.tofile(f)
+            array('q', [self.index[l] for l in self.landmarks]).tofile(f)
+            self.forward.tofile(f)
+            self.backward.tofile(f)
+        with open(path + '.nodes', 'w', encoding='utf-8') as f:
+            f.write('\n'.join(map(repr, self.nodes)))
+
+    @classmethod
+    def load(cls, path, nodes=None):
+        """
+        Reads tables written by save(). Pass nodes (in the original order)
+        to skip parsing the .nodes file.
+        """
+        if nodes is None:
+            from ast import literal_eval
+            with open(path + '.nodes', encoding='utf-8') as f:
+                nodes = [literal_eval(line) for line in f.read().splitlines()]
+        with open(path, 'rb') as f:
+            header = array('q')
+            header.fromfile(f, 2)
+            n, k = header
+            if n != len(nodes):
+                raise ValueError(f'table has {n} nodes, got {len(nodes)}')
+            ids = array('q')
+            ids.fromfile(f, k)
+            forward = array('d')
+            forward.fromfile(f, n * k)
+            backward = array('d')
+            backward.fromfile(f, n * k)
+        return cls(nodes, [nodes[i] for i in ids], forward, backward)
+
+
+if __name__ == '__main__':
+    import random
+    from aastar import astar
+
+    # random sparse directed road-like graph
+    rng = random.Random(1)
+    n = 3000
+    adj = {v: {} for v in range(n)}
+    for v in range(n):
+        for _ in range(3):
+            u = rng.randrange(n)
+            if u != v:
+                adj[v][u] = rng.randint(1, 20)
+                adj[u][v] = rng.randint(1, 20)
+
+    lm = Landmarks.build(adj, lambda s: adj[s], lambda a, b: adj[a][b], count=8)
+
+    expanded = {'none': 0, 'alt': 0}
+    def counting(key):
+        def neighbors(s):
+            expanded[key] += 1
+            return adj[s]
+        return neighbors
+
+    for _ in range(20):
+        s, t = rng.randrange(n), rng.randrange(n)
+        _, c0 = astar(s, lambda x: x == t, counting('none'), lambda a, b: adj[a][b], lambda x: 0)
+        _, c1 = astar(s, lambda x: x == t, counting('alt'), lambda a, b: adj[a][b], lm.heuristic(t))
+        assert c0 == c1
+    print('expansions without heuristic:', expanded['none'])
+    print('expansions with ALT:         ', expanded['alt'])
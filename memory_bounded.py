@@ -0,0 +1,240 @@
+from heapq import heappush, heappop, heapify
+import math
+
+
+# Memory-bounded alternatives to astar(), same
+# (start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn) signature.
+# Both are tree searches: they only avoid cycles along the current path,
+# so they suit huge implicit state spaces rather than small dense graphs.
+# Pass a dict as stats to get expansion / re-expansion counts back.
+
+def ida_star(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, stats=None):
+    """
+    Iterative-deepening A*: depth-first search bounded by an f threshold,
+    raised to the smallest exceeding f after every pass. Memory is the
+    current path plus one neighbor iterator per level.
+    Re-expansions are the expansions made by every pass except the last,
+    i.e. the work repeated because nothing was kept between passes.
+    Returns (path, cost) or (None, inf) if no path.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(expansions=0, reexpansions=0, iterations=0)
+    if goal_test(start):
+        return [start], 0
+
+    threshold = heuristic_fn(start)
+    done = object()
+    while True:
+        stats['iterations'] += 1
+        expansions = 1
+        next_threshold = math.inf
+        path = [start]
+        on_path = {start}
+        stack = [(start, 0, iter(neighbors_fn(start)))]
+
+        while stack:
+            node, g, it = stack[-1]
+            nb = next(it, done)
+            if nb is done:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if nb in on_path:
+                continue
+            tentative_g = g + g_cost_fn(node, nb)
+            f = tentative_g + heuristic_fn(nb)
+            if f > threshold:
+                if f < next_threshold:
+                    next_threshold = f
+                continue
+            if goal_test(nb):
+                stats['expansions'] += expansions
+                path.append(nb)
+                return path, tentative_g
+            path.append(nb)
+            on_path.add(nb)
+            stack.append((nb, tentative_g, iter(neighbors_fn(nb))))
+            expansions += 1
+
+        stats['expansions'] += expansions
+        if next_threshold == math.inf:
+            return None, math.inf
+        stats['reexpansions'] += expansions
+        threshold = next_threshold
+
+
+class _Node:
+    __slots__ = ('state', 'g', 'f', 'parent', 'depth', 'children',
+                 'forgotten', 'expanded', 'version', 'alive')
+
+    def __init__(self, state, g, f, parent, depth):
+        self.state = state
+        self.g = g
+        self.f = f
+        self.parent = parent
+        self.depth = depth
+        self.children = []
+        self.forgotten = {}   # state -> f of dropped children
+        self.expanded = False
+        self.version = 0
+        self.alive = True
+
+    def key(self):
+        # an expanded node only has its forgotten children left to offer
+        if self.expanded:
+            return min(self.forgotten.values(), default=math.inf)
+        return self.f
+
+
+def sma_star(start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn,
+             max_nodes=10000, stats=None):
+    """
+    Simplified Memory-bounded A*: best-first like astar(), but never keeps
+    more than about max_nodes search nodes. When the budget is exceeded the
+    shallowest highest-f leaf is dropped and its f is remembered by its
+    parent, which is re-expanded later if that f becomes the best again.
+    Optimal as long as the optimal path has fewer than max_nodes nodes.
+    Returns (path, cost) or (None, inf) if no path fits in the budget.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(expansions=0, reexpansions=0, dropped=0, peak_nodes=1)
+
+    root = _Node(start, 0, heuristic_fn(start), None, 0)
+    best_heap = []    # (key, -depth, counter, version, node): lowest f, deepest first
+    worst_heap = []   # (-key, depth, counter, version, node): highest f, shallowest first
+    counter = 0
+    live = 1
+
+    def push(n):
+        nonlocal counter
+        n.version += 1
+        k = n.key()
+        if k < math.inf:
+            heappush(best_heap, (k, -n.depth, counter, n.version, n))
+        if not n.children and n is not root:
+            heappush(worst_heap, (-k, n.depth, counter, n.version, n))
+        counter += 1
+
+    def pop_valid(heap):
+        while heap:
+            entry = heappop(heap)
+            n = entry[-1]
+            if n.alive and entry[3] == n.version:
+                return n
+        return None
+
+    def backup(n):
+        # a node's f is the best f among all its successors, live or forgotten;
+        # raising it up the tree is what keeps re-expansions from looping
+        while n is not None:
+            best = n.key()
+            for c in n.children:
+                if c.f < best:
+                    best = c.f
+            if best <= n.f:
+                return
+            n.f = best
+            n = n.parent
+
+    def compact():
+        # stale heap entries would otherwise grow without bound
+        best_heap[:] = [e for e in best_heap if e[-1].alive and e[3] == e[-1].version]
+        worst_heap[:] = [e for e in worst_heap if e[-1].alive and e[3] == e[-1].version]
+        heapify(best_heap)
+        heapify(worst_heap)
+
+    push(root)
+    while True:
+        n = pop_valid(best_heap)
+        if n is None:
+            return None, math.inf
+        if not n.expanded and goal_test(n.state):
+            path = []
+            s = n
+            while s is not None:
+                path.append(s.state)
+                s = s.parent
+            path.reverse()
+            return path, n.g
+
+        stats['expansions'] += 1
+        # on re-expansion only the forgotten children with the best f come back,
+        # each with the f it had when it was dropped
+        remembered = None
+        if n.expanded:
+            stats['reexpansions'] += 1
+            k = n.key()
+            remembered = {s: f for s, f in n.forgotten.items() if f == k}
+            for s in remembered:
+                del n.forgotten[s]
+
+        ancestors = set()
+        s = n
+        while s is not None:
+            ancestors.add(s.state)
+            s = s.parent
+        new = []
+        depth = n.depth + 1
+        for nb in neighbors_fn(n.state):
+            if nb in ancestors or (remembered is not None and nb not in remembered):
+                continue
+            g = n.g + g_cost_fn(n.state, nb)
+            f = max(n.f, g + heuristic_fn(nb))
+            if remembered is not None:
+                f = max(f, remembered[nb])
+            if depth >= max_nodes - 1 and not goal_test(nb):
+                f = math.inf   # too deep to ever reach a goal within the budget
+            child = _Node(nb, g, f, n, depth)
+            n.children.append(child)
+            new.append(child)
+            live += 1
+        n.expanded = True
+        push(n)
+        for child in new:
+            push(child)
+        backup(n)
+        stats['peak_nodes'] = max(stats['peak_nodes'], live)
+
+        # always keep the most promising new child so the search moves forward
+        keep = min(new, key=lambda c: (c.f, -c.depth)) if new else None
+        held = None
+        while live > max_nodes:
+            m = pop_valid(worst_heap)
+            if m is keep:
+                held = m
+                continue
+            if m is None:
+                break
+            p = m.parent
+            p.children.remove(m)
+            p.forgotten[m.state] = m.f
+            m.alive = False
+            live -= 1
+            stats['dropped'] += 1
+            push(p)
+        if held is not None:
+            push(held)
+
+        if len(best_heap) + len(worst_heap) > 4 * live + 64:
+            compact()
+
+
+if __name__ == '__main__':
+    from aastar import Grid, astar, unit_cost
+
+    grid = Grid(12, 12, {(x, 6) for x in range(2, 12)})
+    start, goal = (8, 2), (8, 10)
+    args = (start,
+            lambda s: s == goal,
+            lambda s: grid.neighbors(s),
+            unit_cost,
+            lambda s: grid.manhattan(s, goal))
+
+    print('astar:', astar(*args)[1])
+    stats = {}
+    print('IDA*: ', ida_star(*args, stats=stats)[1], stats)
+    for budget in (40, 200):
+        stats = {}
+        print(f'SMA* ({budget} nodes):', sma_star(*args, max_nodes=budget, stats=stats)[1], stats)
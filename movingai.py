@@ -0,0 +1,145 @@
+from collections import namedtuple
+import math
+import mmap
+import os
+import time
+
+from aastar import BitmapGrid, OCCUPANCY_TABLE, astar, best_first, unit_cost
+
+
+# Loader and benchmark runner for the MovingAI grid benchmark sets
+# (https://movingai.com/benchmarks/formats.html).
+#
+# .map files:  "type octile", "height H", "width W", "map", then H rows of W chars.
+# .scen files: "version 1", then one tab-separated line per query:
+#              bucket  map  width  height  start_x  start_y  goal_x  goal_y  optimal_length
+#
+# Our grids are 4-connected with unit costs while the published
+# optimal_length is octile (8-connected), so optimality gaps are measured
+# against astar() rather than against the scenario file.
+
+Scenario = namedtuple('Scenario', 'bucket map_name width height start goal optimal_length')
+
+
+def load_map(path):
+    """Reads a .map file into a BitmapGrid with one translate() over the mapped rows."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header = {}
+        pos = 0
+        while True:
+            end = mm.find(b'\n', pos)
+            if end == -1:
+                raise ValueError(f'{path}: missing "map" line')
+            line = mm[pos:end].strip()
+            pos = end + 1
+            if line == b'map':
+                break
+            if line:
+                key, _, value = line.partition(b' ')
+                header[key.decode()] = value.strip().decode()
+        width, height = int(header['width']), int(header['height'])
+        # drop line breaks and map every other byte straight to wall / open
+        cells = bytearray(mm[pos:].translate(OCCUPANCY_TABLE, b'\r\n'))
+    if len(cells) != width * height:
+        raise ValueError(f'{path}: expected {width}x{height} cells, got {len(cells)}')
+    return BitmapGrid(width, height, cells=cells)
+
+
+def load_scenarios(path):
+    scenarios = []
+    with open(path, encoding='ascii') as f:
+        for line in f:
+            fields = line.split('\t') if '\t' in line else line.split()
+            if len(fields) < 9 or fields[0] == 'version':
+                continue
+            bucket, map_name, w, h, sx, sy, gx, gy, optimal = fields[:9]
+            scenarios.append(Scenario(int(bucket), map_name, int(w), int(h),
+                                      (int(sx), int(sy)), (int(gx), int(gy)),
+                                      float(optimal)))
+    return scenarios
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    k = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+SEARCHES = {'astar': astar, 'best_first': best_first}
+
+
+def run_benchmark(scen_path, map_dir=None, searches=('astar', 'best_first')):
+    """
+    Replays every scenario through each search and returns
+    {bucket: {search: {'queries', 'expansions', 'p50_ms', 'p95_ms', 'p99_ms',
+                       'mean_gap', 'max_gap', 'unsolved'}}}.
+    The gap is cost / astar cost - 1, so astar itself always reports 0.
+    """
+    if map_dir is None:
+        map_dir = os.path.dirname(scen_path)
+    maps = {}
+    raw = {}   # bucket -> search -> list of (expansions, seconds, cost)
+    optimal = {}
+
+    for sc in load_scenarios(scen_path):
+        grid = maps.get(sc.map_name)
+        if grid is None:
+            grid = maps[sc.map_name] = load_map(os.path.join(map_dir, os.path.basename(sc.map_name)))
+        goal = sc.goal
+        for name in ('astar',) + tuple(s for s in searches if s != 'astar'):
+            expansions = 0
+            def neighbors(s):
+                nonlocal expansions
+                expansions += 1
+                return grid.neighbors(s)
+            t0 = time.perf_counter()
+            _, cost = SEARCHES[name](sc.start,
+                                     lambda s: s == goal,
+                                     neighbors,
+                                     unit_cost,
+                                     lambda s: grid.manhattan(s, goal))
+            elapsed = time.perf_counter() - t0
+            if name == 'astar':
+                optimal[sc] = cost
+            if name in searches:
+                raw.setdefault(sc.bucket, {}).setdefault(name, []).append((expansions, elapsed, cost, sc))
+
+    report = {}
+    for bucket, per_search in sorted(raw.items()):
+        report[bucket] = {}
+        for name, rows in per_search.items():
+            latencies = [r[1] * 1000 for r in rows]
+            gaps = [r[2] / optimal[r[3]] - 1 for r in rows
+                    if r[2] != math.inf and optimal[r[3]] not in (0, math.inf)]
+            report[bucket][name] = {
+                'queries': len(rows),
+                'expansions': sum(r[0] for r in rows) / len(rows),
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'p99_ms': percentile(latencies, 99),
+                'mean_gap': sum(gaps) / len(gaps) if gaps else 0.0,
+                'max_gap': max(gaps, default=0.0),
+                'unsolved': sum(1 for r in rows if r[2] == math.inf),
+            }
+    return report
+
+
+def format_report(report):
+    lines = [f'{"bucket":>6} {"search":<11}{"n":>5}{"expansions":>12}'
+             f'{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"mean gap":>10}{"max gap":>9}']
+    for bucket, per_search in report.items():
+        for name, r in per_search.items():
+            lines.append(f'{bucket:>6} {name:<11}{r["queries"]:>5}{r["expansions"]:>12.1f}'
+                         f'{r["p50_ms"]:>9.2f}{r["p95_ms"]:>9.2f}{r["p99_ms"]:>9.2f}'
+                         f'{r["mean_gap"]:>10.2%}{r["max_gap"]:>9.2%}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) < 2:
+        print('usage: python movingai.py <file.map.scen> [map_dir]')
+        raise SystemExit(1)
+    print(format_report(run_benchmark(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)))
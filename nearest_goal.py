@@ -0,0 +1,122 @@
+import math
+
+from aastar import astar, unit_cost
+
+
+class TargetIndex:
+    """
+    Bucketed spatial index over a set of target cells.
+
+    nearest_distance(p) is the Manhattan distance from p to the closest
+    target. It is the minimum of consistent heuristics, hence consistent
+    itself, so astar() stays optimal when heading for "any target".
+    """
+    def __init__(self, targets, bucket_size=16):
+        self.size = bucket_size
+        self.buckets = {}
+        self.count = 0
+        # bucket extent, only ever grows; bounds the ring search
+        self.lo = (math.inf, math.inf)
+        self.hi = (-math.inf, -math.inf)
+        for t in targets:
+            self.add(t)
+
+    def _bucket(self, p):
+        return (p[0] // self.size, p[1] // self.size)
+
+    def add(self, t):
+        kx, ky = key = self._bucket(t)
+        self.lo = (min(self.lo[0], kx), min(self.lo[1], ky))
+        self.hi = (max(self.hi[0], kx), max(self.hi[1], ky))
+        bucket = self.buckets.setdefault(key, set())
+        if t not in bucket:
+            bucket.add(t)
+            self.count += 1
+
+    def remove(self, t):
+        key = self._bucket(t)
+        bucket = self.buckets.get(key)
+        if bucket and t in bucket:
+            bucket.discard(t)
+            self.count -= 1
+            if not bucket:
+                del self.buckets[key]
+
+    def __contains__(self, t):
+        return t in self.buckets.get(self._bucket(t), ())
+
+    def nearest_distance(self, p):
+        if not self.count:
+            return math.inf
+        bx, by = self._bucket(p)
+        x, y = p
+        best = math.inf
+        # rings of buckets at Chebyshev distance r; anything in ring r + 1 is
+        # at least r*size + 1 away, so stop once best is that close
+        max_r = max(bx - self.lo[0], self.hi[0] - bx, by - self.lo[1], self.hi[1] - by)
+        r = 0
+        while r <= max_r:
+            for key in self._ring(bx, by, r):
+                for tx, ty in self.buckets.get(key, ()):
+                    d = abs(tx - x) + abs(ty - y)
+                    if d < best:
+                        best = d
+            if best <= r * self.size + 1:
+                break
+            r += 1
+        return best
+
+    @staticmethod
+    def _ring(bx, by, r):
+        if r == 0:
+            yield (bx, by)
+            return
+        for dx in range(-r, r + 1):
+            yield (bx + dx, by - r)
+            yield (bx + dx, by + r)
+        for dy in range(-r + 1, r):
+            yield (bx - r, by + dy)
+            yield (bx + r, by + dy)
+
+
+def nearest_target(grid, start, targets, bucket_size=16):
+    """
+    One astar() run from start to whichever target is closest by path length.
+    targets may be a TargetIndex (reused across queries) or any iterable of cells.
+    Returns (path, cost) with the reached target at path[-1], or (None, inf).
+    """
+    index = targets if isinstance(targets, TargetIndex) else TargetIndex(targets, bucket_size)
+    return astar(start,
+                 lambda s: s in index,
+                 lambda s: grid.neighbors(s),
+                 unit_cost,
+                 index.nearest_distance)
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    from aastar import BitmapGrid, open_cells, random_grid
+
+    size = 300
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng, BitmapGrid)
+    free = open_cells(grid)
+    resources = TargetIndex(rng.sample(free, 20))
+    start = rng.choice(free)
+
+    expanded = {'dijkstra': 0, 'indexed': 0}
+    def counting(key):
+        def neighbors(s):
+            expanded[key] += 1
+            return grid.neighbors(s)
+        return neighbors
+
+    t0 = time.perf_counter()
+    _, cost_d = astar(start, lambda s: s in resources, counting('dijkstra'), unit_cost, lambda s: 0)
+    t1 = time.perf_counter()
+    _, cost_i = astar(start, lambda s: s in resources, counting('indexed'), unit_cost,
+                      resources.nearest_distance)
+    t2 = time.perf_counter()
+    print(f'uninformed: cost {cost_d}, {expanded["dijkstra"]} expansions, {t1 - t0:.4f}s')
+    print(f'indexed:    cost {cost_i}, {expanded["indexed"]} expansions, {t2 - t1:.4f}s')
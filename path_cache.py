@@ -0,0 +1,168 @@
+from collections import OrderedDict
+import math
+
+from aastar import Grid, astar, unit_cost
+
+
+class PathCache:
+    """
+    Bounded LRU cache of optimal grid paths in front of astar().
+
+    Entries are keyed by (start, goal); the cache as a whole is stamped with
+    the grid version it is in sync with. Because every sub-path of an optimal path is itself
+    optimal (and, on an undirected grid, so is its reverse), a query between
+    any two cells of a cached path is answered by slicing it.
+
+    Route wall edits through add_wall/remove_wall to invalidate only the
+    affected entries:
+    - a new wall drops the paths that cross it, and cached "no path" answers
+      stay valid;
+    - an opened cell drops the paths it could shorten (checked with a
+      Manhattan lower bound), and every cached "no path" answer.
+    Any other wall edit (Grid.walls is versioned, so that includes editing
+    the set directly) changes the grid's version behind the cache's back,
+    and the whole cache is flushed on the next lookup. Writes straight into
+    BitmapGrid.cells are not versioned; call clear() after those.
+    """
+    def __init__(self, grid, capacity=1024):
+        self.grid = grid
+        self.capacity = capacity
+        self.entries = OrderedDict()   # (start, goal) -> (path, cost, positions)
+        self.by_cell = {}              # cell -> set of keys whose path crosses it
+        self.version = grid.version
+        self.hits = 0
+        self.subpath_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def counters(self):
+        return {'hits': self.hits, 'subpath_hits': self.subpath_hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'invalidations': self.invalidations, 'size': len(self.entries)}
+
+    # ---------- lookups ----------
+
+    def _sync(self):
+        # the grid was edited without telling us: nothing cached can be trusted
+        if self.version != self.grid.version:
+            self.clear()
+
+    def find_path(self, start, goal):
+        """Returns (path, cost) like astar(), from the cache when possible."""
+        self._sync()
+        if not (self._open(start) and self._open(goal)):
+            # astar() can leave a wall start but never enter a wall goal, so
+            # such paths are not reversible: answer them without the cache
+            self.misses += 1
+            return self._search(start, goal)
+
+        key = (start, goal)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0]) if entry[0] else None, entry[1]
+
+        sub = self._subpath(start, goal)
+        if sub is not None:
+            self.subpath_hits += 1
+            return sub, len(sub) - 1
+
+        self.misses += 1
+        path, cost = self._search(start, goal)
+        self._store(key, path, cost)
+        return (list(path) if path else None), cost
+
+    def _open(self, p):
+        return self.grid.in_bounds(p) and self.grid.passable(p)
+
+    def _search(self, start, goal):
+        return astar(start,
+                     lambda s: s == goal,
+                     lambda s: self.grid.neighbors(s),
+                     unit_cost,
+                     lambda s: Grid.manhattan(s, goal))
+
+    def _subpath(self, start, goal):
+        keys = self.by_cell.get(start)
+        other = self.by_cell.get(goal)
+        if not keys or not other:
+            return None
+        for key in keys & other:
+            path, _, positions = self.entries[key]
+            i, j = positions[start], positions[goal]
+            self.entries.move_to_end(key)
+            if i <= j:
+                return path[i:j + 1]
+            return path[j:i + 1][::-1]
+        return None
+
+    def _store(self, key, path, cost):
+        positions = {p: i for i, p in enumerate(path)} if path else {}
+        self.entries[key] = (path, cost, positions)
+        for p in positions:
+            self.by_cell.setdefault(p, set()).add(key)
+        while len(self.entries) > self.capacity:
+            old, _ = next(iter(self.entries.items()))
+            self._drop(old)
+            self.evictions += 1
+
+    def _drop(self, key):
+        path, _, positions = self.entries.pop(key)
+        for p in positions:
+            keys = self.by_cell[p]
+            keys.discard(key)
+            if not keys:
+                del self.by_cell[p]
+
+    def clear(self):
+        self.entries.clear()
+        self.by_cell.clear()
+        self.version = self.grid.version
+
+    # ---------- wall edits ----------
+
+    def add_wall(self, p):
+        self._sync()
+        self.grid.add_wall(p)
+        for key in list(self.by_cell.get(p, ())):
+            self._drop(key)
+            self.invalidations += 1
+        self.version = self.grid.version
+
+    def remove_wall(self, p):
+        self._sync()
+        self.grid.remove_wall(p)
+        for key, (path, cost, _) in list(self.entries.items()):
+            start, goal = key
+            if cost == math.inf or Grid.manhattan(start, p) + Grid.manhattan(p, goal) < cost:
+                self._drop(key)
+                self.invalidations += 1
+        self.version = self.grid.version
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    from aastar import open_cells, random_grid
+
+    size = 100
+    rng = random.Random(1)
+    grid = random_grid(size, 0.2, rng)
+    free = open_cells(grid)
+    hot = [(rng.choice(free), rng.choice(free)) for _ in range(50)]
+    queries = [rng.choice(hot) for _ in range(1000)]
+
+    cache = PathCache(grid, capacity=256)
+    t0 = time.perf_counter()
+    for start, goal in queries:
+        cache.find_path(start, goal)
+    t1 = time.perf_counter()
+    for _ in range(5):
+        cache.add_wall(rng.choice(free))
+    for start, goal in queries[:200]:
+        cache.find_path(start, goal)
+
+    print(f'{len(queries)} queries in {t1 - t0:.3f}s')
+    print(cache.counters())
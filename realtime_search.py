@@ -0,0 +1,121 @@
+from heapq import heappush, heappop
+import math
+
+
+class RealTimeAgent:
+    """
+    Real-Time Adaptive A* (RTAA*) agent with a fixed expansion budget per tick.
+
+    Same callbacks as astar(). Every tick() runs an A* limited to
+    `lookahead` expansions from the agent's position, raises the learned
+    heuristic of every expanded state to f(best frontier state) - g(state),
+    then takes one step towards that frontier state. The learned table is
+    kept across ticks and trips (see reset()), so repeated trips over the
+    same map converge to optimal routes while each tick stays bounded.
+    """
+    def __init__(self, start, goal_test, neighbors_fn, g_cost_fn, heuristic_fn, lookahead=32):
+        if lookahead < 1:
+            raise ValueError('lookahead must be at least 1')
+        self.goal_test = goal_test
+        self.neighbors_fn = neighbors_fn
+        self.g_cost_fn = g_cost_fn
+        self.heuristic_fn = heuristic_fn
+        self.lookahead = lookahead
+        self.learned = {}
+        self.reset(start)
+
+    def reset(self, start):
+        """Start a new trip from start; learned heuristic values are kept."""
+        self.state = start
+        self.trajectory = [start]
+        self.cost = 0
+
+    def h(self, s):
+        value = self.learned.get(s)
+        return self.heuristic_fn(s) if value is None else value
+
+    @property
+    def at_goal(self):
+        return self.goal_test(self.state)
+
+    def tick(self):
+        """
+        Plans with at most `lookahead` expansions and moves one step.
+        Returns the new state (unchanged at the goal), or None if the goal
+        is unreachable from here.
+        """
+        current = self.state
+        if self.goal_test(current):
+            return current
+
+        open_heap = []
+        counter = 0
+        g_score = {current: 0}
+        parent = {current: None}
+        closed = []
+        closed_set = set()
+        heappush(open_heap, (self.h(current), 0, counter, current))
+        counter += 1
+        target = None
+
+        while open_heap:
+            f, g, _, s = heappop(open_heap)
+            if s in closed_set or g != g_score[s]:
+                continue
+            if self.goal_test(s) or len(closed) >= self.lookahead:
+                target = s    # best frontier state, left unexpanded
+                break
+            closed.append(s)
+            closed_set.add(s)
+            for nb in self.neighbors_fn(s):
+                tentative_g = g + self.g_cost_fn(s, nb)
+                if nb in g_score and tentative_g >= g_score[nb]:
+                    continue
+                g_score[nb] = tentative_g
+                parent[nb] = s
+                heappush(open_heap, (tentative_g + self.h(nb), tentative_g, counter, nb))
+                counter += 1
+
+        if target is None:
+            return None
+
+        # RTAA* learning rule: h(s) = f(target) - g(s) for every expanded s
+        f_target = g_score[target] + self.h(target)
+        for s in closed:
+            self.learned[s] = f_target - g_score[s]
+
+        step = target
+        while parent[step] != current:
+            step = parent[step]
+        self.cost += self.g_cost_fn(current, step)
+        self.state = step
+        self.trajectory.append(step)
+        return step
+
+    def run(self, max_ticks=math.inf):
+        """Ticks until the goal, a dead end or max_ticks; returns (trajectory, cost)."""
+        ticks = 0
+        while not self.at_goal and ticks < max_ticks:
+            if self.tick() is None:
+                return None, math.inf
+            ticks += 1
+        return (self.trajectory, self.cost) if self.at_goal else (None, math.inf)
+
+
+if __name__ == '__main__':
+    from aastar import Grid, astar, unit_cost
+
+    grid = Grid(30, 30, {(x, 15) for x in range(3, 30)} | {(10, y) for y in range(0, 12)})
+    start, goal = (25, 2), (25, 28)
+    args = (start,
+            lambda s: s == goal,
+            lambda s: grid.neighbors(s),
+            unit_cost,
+            lambda s: grid.manhattan(s, goal))
+
+    _, optimal = astar(*args)
+    agent = RealTimeAgent(*args, lookahead=16)
+    for trip in range(1, 8):
+        agent.reset(start)
+        _, cost = agent.run()
+        print(f'trip {trip}: cost {cost} (optimal {optimal})')
@@ -1,17 +1,28 @@
 # Single-Source Shortest Path - using Dijkstra's algorithm
 # Find shortest path from one source to all other nodes in weighted graph
 
-def dijkstra_shortest_path(graph, start):
+from dijkstra_engine import dijkstra_search
+
+def dijkstra_shortest_path(graph, start, queue='auto'):
     """
     Single-Source Shortest Path using Dijkstra's Algorithm
     
-    This is a simplified version of Dijkstra's algorithm that finds shortest
-    distances from a source node to all other nodes in a weighted graph.
+    Finds shortest distances from a source node to all other nodes in a
+    weighted graph, using the shared heap-based engine: O((V+E) log V).
     
     graph: dict where graph[node] = [(neighbor, weight), ...]
     start: starting node (source vertex)
+    queue: priority queue backend, as for dijkstra(); None forces the heap
     Returns: dict of shortest distances from start to each node
     """
+    distances, _ = dijkstra_search(graph, start, queue)
+    return distances
+
+def dijkstra_shortest_path_quadratic(graph, start):
+    """
+    Simplified O(V^2) version: linear search for the closest unvisited node
+    every round. Kept for reference and for the crossover benchmark.
+    """
     # Step 1: Initialize distances dictionary
     # Set all distances to infinity except start node (distance = 0)
     distances = {node: float('inf') for node in graph}
@@ -50,26 +61,27 @@ def dijkstra_shortest_path(graph, start):
     
     return distances
 
-# Example weighted graph - adjacency list representation
-# Each node maps to list of (neighbor, weight) tuples
-graph = {
-    'A': [('B', 4), ('C', 2)],      # A connects to B(weight=4), C(weight=2)
-    'B': [('C', 1), ('D', 5)],      # B connects to C(weight=1), D(weight=5)
-    'C': [('D', 8), ('E', 10)],     # C connects to D(weight=8), E(weight=10)
-    'D': [('E', 2)],                # D connects to E(weight=2)
-    'E': []                         # E has no outgoing edges (sink node)
-}
-
-start = 'A'  # Source vertex
-distances = dijkstra_shortest_path(graph, start)
-
-print(f"Single-Source Shortest Path from {start}:")
-print("=" * 40)
-for node, dist in distances.items():
-    if dist == float('inf'):
-        print(f"{start} -> {node}: UNREACHABLE")
-    else:
-        print(f"{start} -> {node}: {dist}")
+if __name__ == '__main__':
+    # Example weighted graph - adjacency list representation
+    # Each node maps to list of (neighbor, weight) tuples
+    graph = {
+        'A': [('B', 4), ('C', 2)],      # A connects to B(weight=4), C(weight=2)
+        'B': [('C', 1), ('D', 5)],      # B connects to C(weight=1), D(weight=5)
+        'C': [('D', 8), ('E', 10)],     # C connects to D(weight=8), E(weight=10)
+        'D': [('E', 2)],                # D connects to E(weight=2)
+        'E': []                         # E has no outgoing edges (sink node)
+    }
+
+    start = 'A'  # Source vertex
+    distances = dijkstra_shortest_path(graph, start)
+
+    print(f"Single-Source Shortest Path from {start}:")
+    print("=" * 40)
+    for node, dist in distances.items():
+        if dist == float('inf'):
+            print(f"{start} -> {node}: UNREACHABLE")
+        else:
+            print(f"{start} -> {node}: {dist}")
 
 # ============================================================================
 # DETAILED ALGORITHM EXPLANATION